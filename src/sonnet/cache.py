@@ -0,0 +1,141 @@
+"""
+Persistent cache for LLM responses.
+"""
+
+from __future__ import annotations
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "sonnet" / "responses.sqlite3"
+
+# Entries older than this are treated as missing
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+
+def make_key(*parts: str) -> str:
+    """
+    Hash request parts into a cache key.
+    
+    Args:
+        parts: Everything that affects the response (model, prompt, ...)
+    
+    Returns:
+        Hex digest key
+    """
+    data = "\0".join(parts).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed string cache with per-entry expiry.
+    
+    Each operation opens its own connection, so one instance can be
+    shared between threads.
+    """
+    
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+    
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """Run one statement in its own transaction and return the first row."""
+        conn = sqlite3.connect(str(self.path), timeout=10.0)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The value, or None if missing or expired
+        """
+        row = self._execute(
+            "SELECT value, expires FROM responses WHERE key = ?", (key,)
+        )
+        if row is None or row[1] <= time.time():
+            return None
+        return row[0]
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value, replacing any existing entry.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, time.time() + self.ttl),
+        )
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU string cache.
+    
+    Sits in front of ResponseCache so repeated prompts within one run
+    skip both the HTTP call and the SQLite lookup.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value, marking it most recently used.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The value, or None if missing
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
@@ -3,16 +3,32 @@ Constraint checker - validate poems against form constraints.
 """
 
 from __future__ import annotations
+import io
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Optional
 
-from sonnet.forms import FormDefinition, get_rhyme_groups, get_syllable_target
+from sonnet.forms import FormDefinition, compile_form
 from sonnet.syllables import count_line_syllables
 from sonnet.rhymes import check_rhyme, RhymeType, get_last_word
-from sonnet.meter import match_meter, MeterType
+from sonnet.meter import match_meter
 
 
-@dataclass
+# Pre-rendered strings for every realistic per-line syllable count
+_INT_STRS = tuple(str(n) for n in range(32))
+
+
+def _int_str(n: int) -> str:
+    """str(n), served from _INT_STRS for small non-negative counts."""
+    return _INT_STRS[n] if 0 <= n < len(_INT_STRS) else str(n)
+
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep instance dicts
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class CheckResult:
     """Result of checking a single constraint on a line."""
     line_index: int
@@ -23,28 +39,42 @@ class CheckResult:
     score: float = 1.0  # 0-1, 1 = perfect
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PoemAnalysis:
-    """Full analysis of a poem against form constraints."""
+    """
+    Full analysis of a poem against form constraints.
+    
+    The pass/score aggregates are computed once at construction, so the
+    result lists should be treated as final once the analysis is built.
+    """
     form: FormDefinition
     lines: List[str]
     syllable_results: List[CheckResult] = field(default_factory=list)
     rhyme_results: List[CheckResult] = field(default_factory=list)
     meter_results: List[CheckResult] = field(default_factory=list)
+    _passed: bool = field(init=False, repr=False, compare=False)
+    _score: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        passed = True
+        total = 0.0
+        count = 0
+        for r in chain(self.syllable_results, self.rhyme_results, self.meter_results):
+            passed = passed and r.passed
+            total += r.score
+            count += 1
+        self._passed = passed
+        self._score = total / count if count else 1.0
     
     @property
     def passed(self) -> bool:
         """Check if all constraints passed."""
-        all_results = self.syllable_results + self.rhyme_results + self.meter_results
-        return all(r.passed for r in all_results)
+        return self._passed
     
     @property
     def overall_score(self) -> float:
         """Get overall score (0-1) averaging all constraint scores."""
-        all_results = self.syllable_results + self.rhyme_results + self.meter_results
-        if not all_results:
-            return 1.0
-        return sum(r.score for r in all_results) / len(all_results)
+        return self._score
 
 
 def check_syllables(lines: List[str], form: FormDefinition) -> List[CheckResult]:
@@ -58,36 +88,60 @@ def check_syllables(lines: List[str], form: FormDefinition) -> List[CheckResult]
     Returns:
         List of CheckResult for each line
     """
-    results = []
+    compiled = compile_form(form)
+    targets = compiled.syllable_targets
     
-    for i, line in enumerate(lines):
-        expected = get_syllable_target(form, i)
-        if expected == 0:  # No constraint (e.g., free verse)
-            results.append(CheckResult(
+    if not compiled.default_syllables and not any(targets):
+        # No syllable constraint (e.g., free verse): every line passes,
+        # so there's nothing to count
+        return [
+            CheckResult(
                 line_index=i,
                 passed=True,
                 constraint="syllables",
                 expected="any",
-                actual=str(count_line_syllables(line)),
+                actual="",
                 score=1.0
-            ))
+            )
+            for i in range(len(lines))
+        ]
+    
+    # Count every line first, then score the (actual, expected) pairs in one pass
+    actuals = [count_line_syllables(line) for line in lines]
+    expecteds = [
+        targets[i] if i < len(targets) else compiled.default_syllables
+        for i in range(len(lines))
+    ]
+    
+    # One result per line, so size the list up front and fill by index
+    results = [None] * len(lines)
+    
+    for i, (actual, expected) in enumerate(zip(actuals, expecteds)):
+        if expected == 0:  # No constraint for this line
+            results[i] = CheckResult(
+                line_index=i,
+                passed=True,
+                constraint="syllables",
+                expected="any",
+                actual=_int_str(actual),
+                score=1.0
+            )
             continue
         
-        actual = count_line_syllables(line)
         diff = abs(actual - expected)
         
         # Allow 1 syllable tolerance, score decreases with distance
         passed = diff <= 1
         score = max(0.0, 1.0 - (diff * 0.2))  # Lose 20% per syllable off
         
-        results.append(CheckResult(
+        results[i] = CheckResult(
             line_index=i,
             passed=passed,
             constraint="syllables",
-            expected=str(expected),
-            actual=str(actual),
+            expected=_int_str(expected),
+            actual=_int_str(actual),
             score=score
-        ))
+        )
     
     return results
 
@@ -108,49 +162,45 @@ def check_rhymes(lines: List[str], form: FormDefinition) -> List[CheckResult]:
     if not form.rhyme_scheme:
         return results  # No rhyme constraint
     
-    groups = get_rhyme_groups(form.rhyme_scheme)
+    # Extract every line's ending word up front; each pair then only indexes
+    last_words = [get_last_word(line) for line in lines]
     
-    for letter, indices in groups.items():
-        if len(indices) < 2:
-            continue  # Need at least 2 lines to check rhyme
-        
-        # Check each line against the first line in its group
-        first_idx = indices[0]
-        first_word = get_last_word(lines[first_idx]) if first_idx < len(lines) else ""
+    # Each line is checked against the first line in its rhyme group
+    for first_idx, idx, letter in compile_form(form).rhyme_pairs:
+        first_word = last_words[first_idx] if first_idx < len(lines) else ""
         
-        for idx in indices[1:]:
-            if idx >= len(lines):
-                results.append(CheckResult(
-                    line_index=idx,
-                    passed=False,
-                    constraint="rhyme",
-                    expected=f"{letter} (missing line)",
-                    actual="",
-                    score=0.0
-                ))
-                continue
-            
-            current_word = get_last_word(lines[idx])
-            rhyme_type = check_rhyme(first_word, current_word)
-            
-            if rhyme_type == RhymeType.PERFECT:
-                passed = True
-                score = 1.0
-            elif rhyme_type == RhymeType.SLANT:
-                passed = True  # Accept slant rhymes
-                score = 0.7
-            else:
-                passed = False
-                score = 0.0
-            
+        if idx >= len(lines):
             results.append(CheckResult(
                 line_index=idx,
-                passed=passed,
+                passed=False,
                 constraint="rhyme",
-                expected=f"{letter} rhymes with line {first_idx + 1} ({first_word})",
-                actual=f"{current_word} ({rhyme_type.value})",
-                score=score
+                expected=f"{letter} (missing line)",
+                actual="",
+                score=0.0
             ))
+            continue
+        
+        current_word = last_words[idx]
+        rhyme_type = check_rhyme(first_word, current_word)
+        
+        if rhyme_type == RhymeType.PERFECT:
+            passed = True
+            score = 1.0
+        elif rhyme_type == RhymeType.SLANT:
+            passed = True  # Accept slant rhymes
+            score = 0.7
+        else:
+            passed = False
+            score = 0.0
+        
+        results.append(CheckResult(
+            line_index=idx,
+            passed=passed,
+            constraint="rhyme",
+            expected=f"{letter} rhymes with line {first_idx + 1} ({first_word})",
+            actual=f"{current_word} ({rhyme_type.value})",
+            score=score
+        ))
     
     return results
 
@@ -166,25 +216,12 @@ def check_meter(lines: List[str], form: FormDefinition) -> List[CheckResult]:
     Returns:
         List of CheckResult for each line
     """
-    results = []
-    
-    if not form.meter:
-        return results  # No meter constraint
-    
-    # Map form meter string to MeterType
-    meter_map = {
-        "iambic": MeterType.IAMBIC,
-        "trochaic": MeterType.TROCHAIC,
-        "anapestic": MeterType.ANAPESTIC,
-        "dactylic": MeterType.DACTYLIC,
-        "spondaic": MeterType.SPONDAIC,
-    }
-    
-    meter_type = meter_map.get(form.meter.lower())
-    if not meter_type:
-        return results  # Unknown meter
+    meter_type = compile_form(form).meter_type
+    if meter_type is None:
+        return []  # No (or unknown) meter constraint
     
     expected_syllables = form.syllables if isinstance(form.syllables, int) else 10
+    results = [None] * len(lines)
     
     for i, line in enumerate(lines):
         score = match_meter(line, meter_type, expected_syllables)
@@ -192,14 +229,14 @@ def check_meter(lines: List[str], form: FormDefinition) -> List[CheckResult]:
         # Consider passing if score >= 0.6
         passed = score >= 0.6
         
-        results.append(CheckResult(
+        results[i] = CheckResult(
             line_index=i,
             passed=passed,
             constraint="meter",
             expected=form.meter,
             actual=f"score={score:.2f}",
             score=score
-        ))
+        )
     
     return results
 
@@ -236,30 +273,31 @@ def format_analysis(analysis: PoemAnalysis) -> str:
     Returns:
         Formatted string with results
     """
-    lines = [
-        f"Form: {analysis.form.name}",
-        f"Overall: {'PASS' if analysis.passed else 'FAIL'} ({analysis.overall_score:.0%})",
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    
+    write(f"Form: {analysis.form.name}\n")
+    write(f"Overall: {'PASS' if analysis.passed else 'FAIL'} ({analysis.overall_score:.0%})\n")
+    write("\n")
     
     if analysis.syllable_results:
-        lines.append("Syllables:")
+        write("Syllables:\n")
         for r in analysis.syllable_results:
-            status = "OK" if r.passed else "FAIL"
-            lines.append(f"  Line {r.line_index + 1}: {r.actual}/{r.expected} [{status}]")
-        lines.append("")
+            # Unconstrained lines aren't counted, so there's no actual to show
+            count = f"{r.actual}/{r.expected}" if r.actual else r.expected
+            write(f"  Line {r.line_index + 1}: {count} [{'OK' if r.passed else 'FAIL'}]\n")
+        write("\n")
     
     if analysis.rhyme_results:
-        lines.append("Rhymes:")
+        write("Rhymes:\n")
         for r in analysis.rhyme_results:
-            status = "OK" if r.passed else "FAIL"
-            lines.append(f"  Line {r.line_index + 1}: {r.actual} [{status}]")
-        lines.append("")
+            write(f"  Line {r.line_index + 1}: {r.actual} [{'OK' if r.passed else 'FAIL'}]\n")
+        write("\n")
     
     if analysis.meter_results:
-        lines.append("Meter:")
+        write("Meter:\n")
         for r in analysis.meter_results:
-            status = "OK" if r.passed else "FAIL"
-            lines.append(f"  Line {r.line_index + 1}: {r.actual} [{status}]")
+            write(f"  Line {r.line_index + 1}: {r.actual} [{'OK' if r.passed else 'FAIL'}]\n")
     
-    return "\n".join(lines)
+    # Every line was written with a trailing newline; drop the last one
+    return buf.getvalue()[:-1]
@@ -1,17 +1,15 @@
 """CLI entry point for Sonnet."""
 
 from __future__ import annotations
+import os
 from pathlib import Path
 from typing import Optional, List
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from sonnet import __version__
 from sonnet.forms import get_form, list_forms, FormDefinition
-from sonnet.checker import check_poem, format_analysis
-from sonnet.generator import generate_poem, GenerationConfig
 
 app = typer.Typer(
     name="sonnet",
@@ -20,6 +18,13 @@ app = typer.Typer(
 console = Console()
 
 
+def _preload_dictionary() -> None:
+    """Start loading the pronunciation dictionary while the command sets up."""
+    if not os.environ.get("SONNET_NO_PRELOAD"):
+        from sonnet.syllables import preload_cmu_dict
+        preload_cmu_dict()
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -38,9 +43,15 @@ def generate(
     form: str = typer.Option("haiku", "--form", "-f", help="Poetic form"),
     theme: str = typer.Option(..., "--theme", "-t", help="Theme or topic"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
-    model: str = typer.Option("llama3", "--model", "-m", help="LLM model name"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="LLM model name [default: $SONNET_MODEL or llama3]"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Draft independent lines concurrently [default: $SONNET_WORKERS or 1]"),
+    stream: bool = typer.Option(False, "--stream", help="Score candidates as they stream in"),
+    whole_poem: Optional[bool] = typer.Option(None, "--whole-poem/--per-line", help="Draft all lines in one LLM call [default: $SONNET_GEN_MODE or per line]"),
 ):
     """Generate a complete poem."""
+    _preload_dictionary()
+    from sonnet.generator import generate_poem, get_config_from_env
+    
     try:
         form_def = get_form(form)
     except ValueError as e:
@@ -50,7 +61,15 @@ def generate(
     console.print(f"[bold]Generating {form_def.name}...[/bold]")
     console.print(f"Theme: {theme}\n")
     
-    config = GenerationConfig(model=model)
+    # Environment settings are the defaults; flags given on the command line win
+    config = get_config_from_env()
+    if model is not None:
+        config.model = model
+    if workers is not None:
+        config.parallel_workers = workers
+    config.stream = stream
+    if whole_poem is not None:
+        config.whole_poem = whole_poem
     
     try:
         lines = generate_poem(form_def, theme, config)
@@ -75,6 +94,9 @@ def check(
     form: str = typer.Option("haiku", "--form", "-f", help="Poetic form to check against"),
 ):
     """Validate a poem against form constraints."""
+    _preload_dictionary()
+    from sonnet.checker import check_poem, format_analysis
+    
     # Get poem lines
     if file:
         if not file.exists():
@@ -109,6 +131,7 @@ def interactive(
     resume: Optional[Path] = typer.Option(None, "--resume", "-r", help="Resume from saved progress"),
 ):
     """Interactive line-by-line composition mode."""
+    _preload_dictionary()
     from sonnet.interactive import run_interactive, load_progress
     
     try:
@@ -145,6 +168,8 @@ def rhymes(
     no_slant: bool = typer.Option(False, "--no-slant", help="Exclude slant rhymes"),
 ):
     """Find rhyming words for a given word."""
+    _preload_dictionary()
+    from rich.table import Table
     from sonnet.rhymes import suggest_rhymes, RhymeType
     
     results = suggest_rhymes(
@@ -210,6 +235,8 @@ def forms(
         if form_def.meter:
             console.print(f"Meter: {form_def.meter}")
     else:
+        from rich.table import Table
+        
         table = Table(title="Available Forms")
         table.add_column("Name", style="cyan")
         table.add_column("Lines", justify="right")
@@ -4,9 +4,10 @@ Configuration loading for Sonnet.
 
 from __future__ import annotations
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 try:
     import tomli
@@ -41,6 +42,28 @@ DEFAULT_CONFIG_PATHS = [
 ]
 
 
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ("true", "1", "yes")
+
+
+# (field, file value coercer, env var, env value coercer) for each setting
+_CONFIG_FIELDS = (
+    ("model", str, "SONNET_MODEL", str),
+    ("api_url", str, "SONNET_API_URL", str),
+    ("temperature", float, "SONNET_TEMPERATURE", float),
+    ("max_tokens", int, "SONNET_MAX_TOKENS", int),
+    ("num_candidates", int, "SONNET_CANDIDATES", int),
+    ("output_dir", str, "SONNET_OUTPUT_DIR", str),
+    ("auto_save", bool, "SONNET_AUTO_SAVE", _env_bool),
+    ("color", bool, "SONNET_COLOR", _env_bool),
+    ("verbose", bool, "SONNET_VERBOSE", _env_bool),
+)
+
+# Environment variables consulted by load_config (part of its cache key)
+ENV_VARS = tuple(env_var for _, _, env_var, _ in _CONFIG_FIELDS)
+
+
 def load_config_file(path: Path) -> Dict[str, Any]:
     """
     Load config from a TOML file.
@@ -74,12 +97,33 @@ def load_config(
     3. Default config file locations
     4. Built-in defaults
     
+    Results are cached per config path and SONNET_* environment values,
+    so config files are only read once; call invalidate_config_cache()
+    after editing one on disk.
+    
     Args:
         config_path: Explicit path to config file
     
     Returns:
         SonnetConfig with merged values
     """
+    env_values = tuple(os.environ.get(name) for name in ENV_VARS)
+    # Hand out a copy so callers can't mutate the cached instance
+    return replace(_load_config_cached(config_path, env_values))
+
+
+def invalidate_config_cache() -> None:
+    """Forget cached configs so the next load_config() re-reads files."""
+    _load_config_cached.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(
+    config_path: Optional[Path],
+    env_values: Tuple[Optional[str], ...],
+) -> SonnetConfig:
+    """Build a SonnetConfig from config files and a SONNET_* env snapshot."""
+    env = dict(zip(ENV_VARS, env_values))
     config = SonnetConfig()
     
     # Try to load from file
@@ -87,69 +131,22 @@ def load_config(
     
     paths_to_try = [config_path] if config_path else DEFAULT_CONFIG_PATHS
     for path in paths_to_try:
-        if path and path.exists():
-            try:
-                file_config = load_config_file(path)
-                break
-            except Exception:
-                pass  # Silently continue to next path
-    
-    # Apply file config
-    if "model" in file_config:
-        config.model = str(file_config["model"])
-    if "api_url" in file_config:
-        config.api_url = str(file_config["api_url"])
-    if "temperature" in file_config:
-        config.temperature = float(file_config["temperature"])
-    if "max_tokens" in file_config:
-        config.max_tokens = int(file_config["max_tokens"])
-    if "num_candidates" in file_config:
-        config.num_candidates = int(file_config["num_candidates"])
-    if "output_dir" in file_config:
-        config.output_dir = str(file_config["output_dir"])
-    if "auto_save" in file_config:
-        config.auto_save = bool(file_config["auto_save"])
-    if "color" in file_config:
-        config.color = bool(file_config["color"])
-    if "verbose" in file_config:
-        config.verbose = bool(file_config["verbose"])
-    
-    # Environment variables override everything
-    env_model = os.environ.get("SONNET_MODEL")
-    if env_model:
-        config.model = env_model
-    
-    env_url = os.environ.get("SONNET_API_URL")
-    if env_url:
-        config.api_url = env_url
-    
-    env_temp = os.environ.get("SONNET_TEMPERATURE")
-    if env_temp:
-        config.temperature = float(env_temp)
-    
-    env_tokens = os.environ.get("SONNET_MAX_TOKENS")
-    if env_tokens:
-        config.max_tokens = int(env_tokens)
-    
-    env_cands = os.environ.get("SONNET_CANDIDATES")
-    if env_cands:
-        config.num_candidates = int(env_cands)
-    
-    env_out = os.environ.get("SONNET_OUTPUT_DIR")
-    if env_out:
-        config.output_dir = env_out
-    
-    env_save = os.environ.get("SONNET_AUTO_SAVE")
-    if env_save:
-        config.auto_save = env_save.lower() in ("true", "1", "yes")
-    
-    env_color = os.environ.get("SONNET_COLOR")
-    if env_color:
-        config.color = env_color.lower() in ("true", "1", "yes")
-    
-    env_verbose = os.environ.get("SONNET_VERBOSE")
-    if env_verbose:
-        config.verbose = env_verbose.lower() in ("true", "1", "yes")
+        if not path:
+            continue
+        # Just try to open it: a missing file costs one failed open, not stat + open
+        try:
+            file_config = load_config_file(path)
+            break
+        except Exception:
+            pass  # Missing or unreadable, silently continue to next path
+    
+    # Apply file config, then environment variables (which override everything)
+    for name, file_coerce, env_var, env_coerce in _CONFIG_FIELDS:
+        if name in file_config:
+            setattr(config, name, file_coerce(file_config[name]))
+        env_value = env[env_var]
+        if env_value:
+            setattr(config, name, env_coerce(env_value))
     
     return config
 
@@ -4,7 +4,10 @@ Poetic form definitions.
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Union, List, Dict
+from functools import lru_cache
+from typing import Optional, Union, List, Dict, Tuple
+
+from sonnet.meter import MeterType, parse_meter
 
 
 @dataclass
@@ -18,6 +21,21 @@ class FormDefinition:
     description: str
 
 
+@dataclass
+class CompiledForm(FormDefinition):
+    """
+    A FormDefinition with its derived constraint data resolved up front.
+    
+    Built by compile_form() so checkers can index per-line targets and
+    rhyme groups directly instead of re-deriving them on every call.
+    """
+    syllable_targets: Tuple[int, ...]  # Per-line targets (0 = no constraint)
+    default_syllables: int             # Target for lines past syllable_targets
+    rhyme_groups: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    rhyme_pairs: Tuple[Tuple[int, int, str], ...]  # (group's first line, other line, letter)
+    meter_type: Optional[MeterType]
+
+
 # Sestina end-word rotation pattern
 # Each stanza uses the same 6 words as line endings, but in a rotating order
 # Pattern: line endings go to positions (6,1,5,2,4,3) -> previous stanza's order
@@ -151,7 +169,49 @@ FORMS: Dict[str, FormDefinition] = {
 }
 
 
-def get_form(name: str) -> FormDefinition:
+def compile_form(form: FormDefinition) -> CompiledForm:
+    """
+    Precompute a form's per-line syllable targets, rhyme groups and meter.
+    
+    Args:
+        form: Form definition to compile (returned as-is if already compiled)
+    
+    Returns:
+        CompiledForm carrying the original definition plus derived data
+    """
+    if isinstance(form, CompiledForm):
+        return form
+    
+    if isinstance(form.syllables, int):
+        syllable_targets = (form.syllables,) * form.lines
+        default_syllables = form.syllables
+    else:
+        syllable_targets = tuple(form.syllables)
+        default_syllables = 0
+    
+    rhyme_groups = parse_rhyme_scheme(form.rhyme_scheme) if form.rhyme_scheme else ()
+    rhyme_pairs = tuple(
+        (indices[0], other, letter)
+        for letter, indices in rhyme_groups
+        for other in indices[1:]
+    )
+    
+    return CompiledForm(
+        name=form.name,
+        lines=form.lines,
+        syllables=form.syllables,
+        rhyme_scheme=form.rhyme_scheme,
+        meter=form.meter,
+        description=form.description,
+        syllable_targets=syllable_targets,
+        default_syllables=default_syllables,
+        rhyme_groups=rhyme_groups,
+        rhyme_pairs=rhyme_pairs,
+        meter_type=parse_meter(form.meter),
+    )
+
+
+def get_form(name: str) -> CompiledForm:
     """
     Get a form definition by name.
     
@@ -159,14 +219,17 @@ def get_form(name: str) -> FormDefinition:
         name: Form name (case-insensitive, underscores/hyphens normalized)
     
     Returns:
-        FormDefinition for the requested form
+        CompiledForm for the requested form
     
     Raises:
         ValueError: If form name not found
     """
+    form = _FORM_ALIASES.get(name)
+    if form is not None:
+        return form
     normalized = name.lower().replace("-", "_").replace(" ", "_")
-    if normalized in FORMS:
-        return FORMS[normalized]
+    if normalized in _COMPILED:
+        return _COMPILED[normalized]
     raise ValueError(f"Unknown form: {name}. Available: {', '.join(FORMS.keys())}")
 
 
@@ -180,6 +243,29 @@ def list_forms() -> List[str]:
     return list(FORMS.keys())
 
 
+@lru_cache(maxsize=None)
+def parse_rhyme_scheme(scheme: str) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+    """
+    Parse a rhyme scheme into immutable (letter, line indices) groups.
+    
+    Cached per scheme string, so callers must not rely on getting a fresh
+    object back; use get_rhyme_groups() for a mutable dict.
+    
+    Args:
+        scheme: Rhyme scheme string, e.g., "ABAB" or "AABBA"
+    
+    Returns:
+        Tuple of (rhyme letter, tuple of 0-indexed line positions) pairs,
+        in order of each letter's first appearance
+    """
+    groups: Dict[str, List[int]] = {}
+    for i, letter in enumerate(scheme.upper()):
+        if letter not in groups:
+            groups[letter] = []
+        groups[letter].append(i)
+    return tuple((letter, tuple(indices)) for letter, indices in groups.items())
+
+
 def get_rhyme_groups(scheme: str) -> Dict[str, List[int]]:
     """
     Parse a rhyme scheme into groups of line indices that should rhyme.
@@ -196,12 +282,7 @@ def get_rhyme_groups(scheme: str) -> Dict[str, List[int]]:
         >>> get_rhyme_groups("AABBA")
         {'A': [0, 1, 4], 'B': [2, 3]}
     """
-    groups: Dict[str, List[int]] = {}
-    for i, letter in enumerate(scheme.upper()):
-        if letter not in groups:
-            groups[letter] = []
-        groups[letter].append(i)
-    return groups
+    return {letter: list(indices) for letter, indices in parse_rhyme_scheme(scheme)}
 
 
 def get_syllable_target(form: FormDefinition, line_index: int) -> int:
@@ -215,8 +296,35 @@ def get_syllable_target(form: FormDefinition, line_index: int) -> int:
     Returns:
         Target syllable count (0 means no constraint)
     """
+    if isinstance(form, CompiledForm):
+        targets = form.syllable_targets
+        if 0 <= line_index < len(targets):
+            return targets[line_index]
+        return form.default_syllables
+    
+    # Raw definitions are read directly; compiling one per call costs more
     if isinstance(form.syllables, int):
         return form.syllables
     if 0 <= line_index < len(form.syllables):
         return form.syllables[line_index]
     return 0
+
+
+# Built once at import; get_form() hands these out instead of the raw FORMS
+_COMPILED: Dict[str, CompiledForm] = {key: compile_form(form) for key, form in FORMS.items()}
+
+
+def _name_variants(key: str) -> List[str]:
+    """Spellings of a form key that get_form would normalize back to it."""
+    variants = []
+    for spelled in (key, key.replace("_", "-"), key.replace("_", " ")):
+        variants.extend((spelled, spelled.upper(), spelled.title(), spelled.capitalize()))
+    return variants
+
+
+# Common spellings -> compiled form, so get_form can skip normalization
+_FORM_ALIASES: Dict[str, CompiledForm] = {
+    variant: form
+    for key, form in _COMPILED.items()
+    for variant in _name_variants(key)
+}
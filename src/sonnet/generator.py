@@ -3,10 +3,16 @@ LLM-based line generation for poetry.
 """
 
 from __future__ import annotations
+import atexit
+import json
 import os
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Iterable, Iterator, TextIO, Tuple, Union
 
 try:
     import httpx
@@ -14,22 +20,55 @@ try:
 except ImportError:
     HAS_HTTPX = False
 
-from sonnet.forms import FormDefinition, get_syllable_target, get_rhyme_groups
-from sonnet.ranker import Constraints, get_best_candidate
+from sonnet.cache import DEFAULT_CACHE_PATH, MemoryCache, ResponseCache, make_key
+from sonnet.forms import FormDefinition, compile_form, get_syllable_target, parse_rhyme_scheme
+from sonnet.ranker import Constraints, get_best_candidate, score_candidate
 
 
-def load_vocabulary(path: str) -> set[str]:
+# Leading candidate numbering like "1.", "2)", "3:"
+_NUMBERED_RE = re.compile(r"^\d+[\.\)\:]?\s*(.+)$")
+
+# Anything that isn't a word character or whitespace
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Deletion table for the ASCII characters _PUNCT_RE matches
+_ASCII_PUNCT = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _PUNCT_RE.match(c))
+)
+
+# Letter-only words for vocabulary checks
+_LETTERS_RE = re.compile(r'[a-zA-Z]+')
+
+# Maps the ASCII characters _LETTERS_RE skips to spaces, so split() gives
+# the same words for ASCII lines
+_ASCII_NON_LETTERS = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not _LETTERS_RE.match(c)
+})
+
+
+def load_vocabulary(source: Union[str, os.PathLike, TextIO]) -> frozenset[str]:
     """
     Load vocabulary from a file (one word per line).
     
     Args:
-        path: Path to vocabulary file
+        source: Path to vocabulary file, or an open text file
         
     Returns:
-        Set of allowed words (lowercase)
+        Frozen set of allowed words (lowercase)
     """
-    with open(path, 'r') as f:
-        return {line.strip().lower() for line in f if line.strip()}
+    if hasattr(source, "read"):
+        return _parse_vocabulary(source.read())
+    with open(source, 'r') as f:
+        return _parse_vocabulary(f.read())
+
+
+def _parse_vocabulary(text: str) -> frozenset[str]:
+    """Collect the non-blank lines of a vocabulary file, lowercased."""
+    # Lowercasing and splitting the whole text at once avoids a
+    # lower() and two strip() calls per line
+    words = {line.strip() for line in text.lower().splitlines()}
+    words.discard("")
+    return frozenset(words)
 
 
 def check_vocabulary(line: str, vocabulary: set[str]) -> bool:
@@ -43,9 +82,13 @@ def check_vocabulary(line: str, vocabulary: set[str]) -> bool:
     Returns:
         True if all words are in vocabulary, False otherwise
     """
-    # Extract words (letters only, lowercase)
-    words = re.findall(r'[a-zA-Z]+', line.lower())
-    return all(word in vocabulary for word in words)
+    # Extract words (letters only, lowercase); ASCII lines take the
+    # translate fast path
+    if line.isascii():
+        words = line.translate(_ASCII_NON_LETTERS).lower().split()
+    else:
+        words = _LETTERS_RE.findall(line.lower())
+    return vocabulary.issuperset(words)
 
 
 def filter_by_vocabulary(candidates: list, vocabulary: set[str]) -> list:
@@ -71,6 +114,12 @@ class GenerationConfig:
     max_tokens: int = 200
     num_candidates: int = 5
     vocabulary: Optional[set[str]] = None  # If set, only allow these words
+    parallel_workers: int = 1  # >1 drafts independent lines concurrently
+    stream: bool = False  # Score candidates as the model streams them
+    cache_path: Optional[str] = str(DEFAULT_CACHE_PATH)  # None disables caching
+    memory_cache_size: int = 128  # In-process response cache entries; 0 disables
+    cache_sampled: bool = False  # Also cache temperature > 0 responses
+    whole_poem: bool = False  # Draft every line in one LLM call, then pick per line
 
 
 @dataclass
@@ -89,9 +138,37 @@ def get_config_from_env() -> GenerationConfig:
         temperature=float(os.environ.get("SONNET_TEMPERATURE", "0.8")),
         max_tokens=int(os.environ.get("SONNET_MAX_TOKENS", "200")),
         num_candidates=int(os.environ.get("SONNET_CANDIDATES", "5")),
+        parallel_workers=int(os.environ.get("SONNET_WORKERS", "1")),
+        memory_cache_size=int(os.environ.get("SONNET_LLM_CACHE_SIZE", "128")),
+        cache_sampled=os.environ.get("SONNET_LLM_CACHE_FORCE", "").lower() in ("1", "true", "yes"),
+        whole_poem=os.environ.get("SONNET_GEN_MODE", "per_line") == "whole_poem",
     )
 
 
+@lru_cache(maxsize=64)
+def _form_header(
+    name: str,
+    description: str,
+    lines: int,
+    syllable_targets: Tuple[int, ...],
+    rhyme_scheme: Optional[str],
+    meter: Optional[str],
+) -> str:
+    """The form rules every prompt starts with (cached)."""
+    parts = [f"You are writing a {name}: {description}."]
+    if lines:
+        parts.append(f"It has {lines} lines.")
+    if len(set(syllable_targets)) == 1 and syllable_targets[0]:
+        parts.append(f"Each line has {syllable_targets[0]} syllables.")
+    elif any(syllable_targets):
+        parts.append(f"Syllables per line: {', '.join(map(str, syllable_targets))}.")
+    if rhyme_scheme:
+        parts.append(f"Rhyme scheme: {rhyme_scheme}.")
+    if meter:
+        parts.append(f"Meter: {meter}.")
+    return "\n".join(parts)
+
+
 def build_prompt(
     form: FormDefinition,
     theme: str,
@@ -102,6 +179,10 @@ def build_prompt(
     """
     Build a prompt for generating the next line.
     
+    Content that stays the same across a poem comes first (form rules,
+    then theme, then earlier lines in order), so each line's prompt
+    extends the previous one and server-side prompt caches can reuse it.
+    
     Args:
         form: The poetic form
         theme: Theme or topic of the poem
@@ -112,10 +193,18 @@ def build_prompt(
     Returns:
         Prompt string for the LLM
     """
-    target_syllables = get_syllable_target(form, line_index)
+    compiled = compile_form(form)
+    target_syllables = get_syllable_target(compiled, line_index)
     
     prompt_parts = [
-        f"You are writing a {form.name} about '{theme}'.",
+        _form_header(
+            form.name, form.description, form.lines, compiled.syllable_targets,
+            form.rhyme_scheme, form.meter,
+        ),
+        f"For each line requested, provide {5} alternative lines, one per line, numbered 1-5.",
+        "Just the lines, no explanations.",
+        "",
+        f"Theme: '{theme}'.",
         "",
     ]
     
@@ -138,15 +227,25 @@ def build_prompt(
     if constraints:
         prompt_parts.append(f"Constraints: {', '.join(constraints)}.")
     
-    prompt_parts.extend([
-        "",
-        f"Provide {5} alternative lines, one per line, numbered 1-5.",
-        "Just the lines, no explanations.",
-    ])
-    
     return "\n".join(prompt_parts)
 
 
+def _parse_candidate_line(line: str) -> Optional[str]:
+    """Extract a candidate from one response line, or None to skip it."""
+    line = line.strip()
+    if not line:
+        return None
+    
+    # Remove numbering like "1.", "1)", "1:"
+    match = _NUMBERED_RE.match(line)
+    if match:
+        return match.group(1).strip()
+    if not line[0].isdigit():
+        # Unnumbered lines
+        return line
+    return None
+
+
 def parse_candidates(response: str) -> List[str]:
     """
     Parse numbered lines from LLM response.
@@ -160,21 +259,87 @@ def parse_candidates(response: str) -> List[str]:
     candidates = []
     
     for line in response.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Remove numbering like "1.", "1)", "1:"
-        match = re.match(r"^\d+[\.\)\:]?\s*(.+)$", line)
-        if match:
-            candidates.append(match.group(1).strip())
-        elif not line[0].isdigit():
-            # Unnumbered lines
-            candidates.append(line)
+        candidate = _parse_candidate_line(line)
+        if candidate is not None:
+            candidates.append(candidate)
     
     return candidates
 
 
+def iter_candidates(fragments: Iterable[str]) -> Iterator[str]:
+    """
+    Parse candidates out of a streamed response as each line completes.
+    
+    Yields the same candidates, in the same order, as parse_candidates
+    would for the joined response.
+    
+    Args:
+        fragments: Pieces of response text, in order
+    
+    Yields:
+        Extracted line candidates
+    """
+    buffer = ""
+    for fragment in fragments:
+        buffer += fragment
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            candidate = _parse_candidate_line(line)
+            if candidate is not None:
+                yield candidate
+    
+    candidate = _parse_candidate_line(buffer)
+    if candidate is not None:
+        yield candidate
+
+
+def build_whole_poem_prompt(form: FormDefinition, theme: str, num_poems: int) -> str:
+    """
+    Build a prompt asking for several complete drafts of a poem at once.
+    
+    Args:
+        form: The poetic form
+        theme: Theme or topic of the poem
+        num_poems: How many alternative drafts to ask for
+    
+    Returns:
+        Prompt string for the LLM
+    """
+    compiled = compile_form(form)
+    return "\n".join([
+        _form_header(
+            form.name, form.description, form.lines, compiled.syllable_targets,
+            form.rhyme_scheme, form.meter,
+        ),
+        f"Write {num_poems} different complete versions, {form.lines} lines each.",
+        f"Start each with 'Poem N:' on its own line, then number its lines 1-{form.lines}.",
+        "Just the poems, no explanations.",
+        "",
+        f"Theme: '{theme}'.",
+    ])
+
+
+# "Poem 2:" style labels between whole-poem drafts
+_POEM_LABEL_RE = re.compile(r"^\s*\**poem\s+\d+\s*:?\**\s*$", re.IGNORECASE | re.MULTILINE)
+
+
+def parse_whole_poems(response: str, n_lines: int) -> List[List[str]]:
+    """
+    Split a whole-poem response into drafts of at most n_lines lines each.
+    
+    A response without "Poem N:" labels is treated as a single draft.
+    
+    Args:
+        response: Raw LLM response text
+        n_lines: Lines per poem; extra lines in a draft are dropped
+    
+    Returns:
+        Non-empty drafts, each a list of line texts in order
+    """
+    drafts = (parse_candidates(block)[:n_lines] for block in _POEM_LABEL_RE.split(response))
+    return [draft for draft in drafts if draft]
+
+
 def call_llm(prompt: str, config: GenerationConfig) -> str:
     """
     Call the LLM API to generate text.
@@ -192,24 +357,167 @@ def call_llm(prompt: str, config: GenerationConfig) -> str:
     if not HAS_HTTPX:
         raise RuntimeError("httpx is required for LLM calls: pip install httpx")
     
-    payload = {
+    # Only deterministic (temperature 0) responses are worth replaying,
+    # unless the caller opts in to caching sampled ones too
+    cache = memory = None
+    if config.temperature == 0 or config.cache_sampled:
+        key = make_key(
+            config.api_url, config.model, str(config.temperature),
+            str(config.max_tokens), prompt,
+        )
+        memory = _get_memory_cache(config.memory_cache_size)
+        cached = memory.get(key) if memory is not None else None
+        if cached is not None:
+            return cached
+        
+        if config.cache_path:
+            cache = _get_response_cache(config.cache_path)
+            cached = _cache_get(cache, key)
+            if cached is not None:
+                if memory is not None:
+                    memory.set(key, cached)
+                return cached
+    
+    payload = _build_payload(prompt, config, stream=False)
+    
+    try:
+        response = _get_client().post(config.api_url, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        text = data.get("response", "")
+    except Exception as e:
+        raise RuntimeError(f"LLM call failed: {e}")
+    
+    if text:
+        if memory is not None:
+            memory.set(key, text)
+        if cache is not None:
+            _cache_set(cache, key, text)
+    return text
+
+
+# Shared HTTP client, so connections to the LLM server are kept alive
+# across calls; created on first use
+_CLIENT: Optional["httpx.Client"] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> "httpx.Client":
+    """Get the shared HTTP client, creating it if necessary (thread-safe)."""
+    global _CLIENT
+    client = _CLIENT
+    if client is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    timeout=60.0,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                )
+            client = _CLIENT
+    return client
+
+
+def close_client() -> None:
+    """Close the shared HTTP client; the next LLM call opens a new one."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        client, _CLIENT = _CLIENT, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_client)
+
+
+@lru_cache(maxsize=None)
+def _get_memory_cache(size: int) -> Optional[MemoryCache]:
+    """Get the in-process response cache holding size entries, or None if 0."""
+    return MemoryCache(size) if size > 0 else None
+
+
+def clear_caches() -> None:
+    """Drop the in-process response caches (the on-disk cache is kept)."""
+    _get_memory_cache.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_response_cache(path: str) -> Optional[ResponseCache]:
+    """Open the response cache at path, or None if it can't be used."""
+    try:
+        return ResponseCache(path)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _cache_get(cache: Optional[ResponseCache], key: str) -> Optional[str]:
+    """Read from the response cache, treating any failure as a miss."""
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except sqlite3.Error:
+        return None
+
+
+def _cache_set(cache: Optional[ResponseCache], key: str, value: str) -> None:
+    """Write to the response cache, ignoring failures."""
+    if cache is None:
+        return
+    try:
+        cache.set(key, value)
+    except sqlite3.Error:
+        pass
+
+
+def stream_llm(prompt: str, config: GenerationConfig) -> Iterator[str]:
+    """
+    Call the LLM API and yield text as it is generated.
+    
+    Closing the iterator early closes the connection, which stops
+    generation on the server.
+    
+    Args:
+        prompt: The prompt to send
+        config: Generation configuration
+    
+    Yields:
+        Fragments of the generated text response
+    
+    Raises:
+        RuntimeError: If httpx not available or API call fails
+    """
+    if not HAS_HTTPX:
+        raise RuntimeError("httpx is required for LLM calls: pip install httpx")
+    
+    payload = _build_payload(prompt, config, stream=True)
+    
+    try:
+        with _get_client().stream("POST", config.api_url, json=payload) as response:
+            response.raise_for_status()
+            for raw in response.iter_lines():
+                if not raw:
+                    continue
+                data = json.loads(raw)
+                fragment = data.get("response", "")
+                if fragment:
+                    yield fragment
+                if data.get("done"):
+                    break
+    except Exception as e:
+        raise RuntimeError(f"LLM call failed: {e}")
+
+
+def _build_payload(prompt: str, config: GenerationConfig, stream: bool) -> Dict[str, Any]:
+    """Build the generate-API request body."""
+    return {
         "model": config.model,
         "prompt": prompt,
-        "stream": False,
+        "stream": stream,
         "options": {
             "temperature": config.temperature,
             "num_predict": config.max_tokens,
         }
     }
-    
-    try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(config.api_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "")
-    except Exception as e:
-        raise RuntimeError(f"LLM call failed: {e}")
 
 
 def generate_candidates(
@@ -237,6 +545,11 @@ def generate_candidates(
     if config is None:
         config = get_config_from_env()
     
+    if config.stream:
+        return list(stream_candidates(
+            form, theme, line_index, prior_lines, rhyme_word, config
+        ))
+    
     prompt = build_prompt(form, theme, line_index, prior_lines, rhyme_word)
     response = call_llm(prompt, config)
     lines = parse_candidates(response)
@@ -250,6 +563,46 @@ def generate_candidates(
     return candidates
 
 
+def stream_candidates(
+    form: FormDefinition,
+    theme: str,
+    line_index: int,
+    prior_lines: List[str],
+    rhyme_word: Optional[str],
+    config: GenerationConfig,
+) -> Iterator[Candidate]:
+    """
+    Yield candidate lines as the model streams them.
+    
+    Stops reading once config.num_candidates lines have arrived; the
+    vocabulary filter, if configured, is applied to each line.
+    
+    Args:
+        form: The poetic form
+        theme: Theme or topic
+        line_index: Which line we're generating
+        prior_lines: Previously generated lines
+        rhyme_word: Word that this line must rhyme with
+        config: Generation configuration
+    
+    Yields:
+        Candidate objects
+    """
+    if config.num_candidates <= 0:
+        return
+    
+    prompt = build_prompt(form, theme, line_index, prior_lines, rhyme_word)
+    fragments = stream_llm(prompt, config)
+    try:
+        for count, line in enumerate(iter_candidates(fragments), 1):
+            if not config.vocabulary or check_vocabulary(line, config.vocabulary):
+                yield Candidate(text=line)
+            if count >= config.num_candidates:
+                break
+    finally:
+        fragments.close()
+
+
 def get_ending_word(line: str) -> Optional[str]:
     """
     Extract the last word from a line, ignoring punctuation.
@@ -260,12 +613,27 @@ def get_ending_word(line: str) -> Optional[str]:
     Returns:
         The last word, or None if line is empty
     """
-    # Remove trailing punctuation and get words
-    cleaned = re.sub(r'[^\w\s]', '', line.strip())
+    # Remove punctuation and get words; translate is much faster than
+    # the regex but only covers ASCII
+    line = line.strip()
+    if line.isascii():
+        cleaned = line.translate(_ASCII_PUNCT)
+    else:
+        cleaned = _PUNCT_RE.sub('', line)
     words = cleaned.split()
     return words[-1].lower() if words else None
 
 
+@lru_cache(maxsize=None)
+def _rhyme_leaders(scheme: str) -> Tuple[int, ...]:
+    """For each position in a rhyme scheme, the first line with its letter."""
+    leaders = [0] * len(scheme)
+    for _, indices in parse_rhyme_scheme(scheme):
+        for i in indices:
+            leaders[i] = indices[0]
+    return tuple(leaders)
+
+
 def get_rhyme_word_for_line(
     form: FormDefinition,
     line_index: int,
@@ -288,22 +656,206 @@ def get_rhyme_word_for_line(
     if not form.rhyme_scheme:
         return None
     
-    scheme = form.rhyme_scheme.upper()
-    if line_index >= len(scheme):
+    leaders = _rhyme_leaders(form.rhyme_scheme)
+    if line_index >= len(leaders):
         return None
     
-    current_letter = scheme[line_index]
-    
-    # Find the first prior line with the same letter
-    for prior_idx in range(line_index):
-        if prior_idx < len(scheme) and scheme[prior_idx] == current_letter:
-            # This prior line should rhyme with us
-            if prior_idx < len(prior_lines):
-                return get_ending_word(prior_lines[prior_idx])
+    # The first line with the same letter is the one we rhyme with
+    first = leaders[line_index]
+    if first < line_index and first < len(prior_lines):
+        return get_ending_word(prior_lines[first])
     
     return None
 
 
+def _generate_line(
+    form: FormDefinition,
+    theme: str,
+    line_index: int,
+    prior_lines: List[str],
+    rhyme_word: Optional[str],
+    config: GenerationConfig,
+) -> str:
+    """
+    Generate candidates for one line and return the best-ranked text.
+    
+    Returns an empty string if the model produced no usable candidates.
+    """
+    if config.stream:
+        return _generate_line_streaming(
+            form, theme, line_index, prior_lines, rhyme_word, config
+        )
+    
+    candidates = generate_candidates(
+        form=form,
+        theme=theme,
+        line_index=line_index,
+        prior_lines=prior_lines,
+        rhyme_word=rhyme_word,
+        config=config,
+    )
+    
+    if not candidates:
+        return ""
+    
+    # Use ranker to pick best candidate
+    constraints = _line_constraints(form, line_index, rhyme_word)
+    candidate_texts = [c.text for c in candidates]
+    best = get_best_candidate(candidate_texts, constraints)
+    return best.text if best else candidates[0].text
+
+
+def _line_constraints(
+    form: FormDefinition,
+    line_index: int,
+    rhyme_word: Optional[str],
+) -> Constraints:
+    """Ranking constraints for one line of a form."""
+    target = get_syllable_target(form, line_index)
+    return Constraints(
+        target_syllables=target,
+        rhyme_word=rhyme_word,
+        meter=form.meter,
+        expected_syllables=target if isinstance(form.syllables, int) else 10,
+    )
+
+
+def _generate_line_streaming(
+    form: FormDefinition,
+    theme: str,
+    line_index: int,
+    prior_lines: List[str],
+    rhyme_word: Optional[str],
+    config: GenerationConfig,
+) -> str:
+    """
+    Score candidates as they stream in and return the best text.
+    
+    Picks the same line as ranking the full batch would, but stops the
+    stream as soon as a candidate satisfies every constraint.
+    """
+    constraints = _line_constraints(form, line_index, rhyme_word)
+    
+    best_text = ""
+    best_total = -1.0
+    stream = stream_candidates(form, theme, line_index, prior_lines, rhyme_word, config)
+    try:
+        for candidate in stream:
+            total = score_candidate(candidate.text, constraints).total
+            if total > best_total:
+                best_text, best_total = candidate.text, total
+                if total >= 1.0:
+                    break
+    finally:
+        stream.close()
+    
+    return best_text
+
+
+def get_generation_levels(form: FormDefinition) -> List[List[int]]:
+    """
+    Group line indices into batches that can be generated concurrently.
+    
+    Level 0 holds every line with no rhyme target of its own (the first
+    line of each rhyme group, and all lines of unrhymed forms). Level 1
+    holds the lines that must rhyme with a level-0 line.
+    
+    Args:
+        form: The poetic form
+    
+    Returns:
+        Non-empty lists of 0-indexed line numbers, in generation order
+    """
+    scheme = form.rhyme_scheme.upper() if form.rhyme_scheme else ""
+    seen = set()
+    leaders: List[int] = []
+    followers: List[int] = []
+    
+    for i in range(form.lines):
+        letter = scheme[i] if i < len(scheme) else None
+        if letter is None or letter not in seen:
+            leaders.append(i)
+            if letter is not None:
+                seen.add(letter)
+        else:
+            followers.append(i)
+    
+    return [level for level in (leaders, followers) if level]
+
+
+def _generate_poem_parallel(
+    form: FormDefinition,
+    theme: str,
+    config: GenerationConfig,
+) -> List[str]:
+    """
+    Generate a poem level by level, drafting each level's lines concurrently.
+    
+    Each line sees the contiguous run of already-committed lines before it
+    as context. A line that comes back empty is retried once on its own
+    rather than redoing the whole level.
+    """
+    lines = [""] * form.lines
+    committed = [False] * form.lines
+    
+    def draft(i: int) -> str:
+        prior_end = 0
+        while prior_end < i and committed[prior_end]:
+            prior_end += 1
+        # Leaders are always committed before their followers are drafted
+        rhyme_word = get_rhyme_word_for_line(form, i, lines[:i])
+        prior = lines[:prior_end]
+        text = _generate_line(form, theme, i, prior, rhyme_word, config)
+        if not text:
+            text = _generate_line(form, theme, i, prior, rhyme_word, config)
+        return text
+    
+    with ThreadPoolExecutor(max_workers=config.parallel_workers) as executor:
+        for level in get_generation_levels(form):
+            # Collect the whole level before committing so every draft in it
+            # sees the same context regardless of completion order
+            drafted = list(executor.map(draft, level))
+            for i, text in zip(level, drafted):
+                lines[i] = text
+                committed[i] = True
+    
+    return lines
+
+
+def _generate_poem_whole(
+    form: FormDefinition,
+    theme: str,
+    config: GenerationConfig,
+) -> List[str]:
+    """
+    Draft whole poems in one LLM call, then pick the best line per position.
+    
+    Lines are chosen in order, so rhyme targets come from the lines already
+    picked. A position no draft covers (or whose options are all filtered
+    out by the vocabulary) falls back to a per-line call.
+    """
+    # Room for every draft's lines, at roughly 20 tokens a line
+    needed = 20 * form.lines * config.num_candidates
+    call_config = replace(config, max_tokens=max(config.max_tokens, needed))
+    prompt = build_whole_poem_prompt(form, theme, config.num_candidates)
+    drafts = parse_whole_poems(call_llm(prompt, call_config), form.lines)
+    
+    lines: List[str] = []
+    for i in range(form.lines):
+        rhyme_word = get_rhyme_word_for_line(form, i, lines)
+        options = [draft[i] for draft in drafts if i < len(draft)]
+        if config.vocabulary:
+            options = [t for t in options if check_vocabulary(t, config.vocabulary)]
+        
+        best = get_best_candidate(options, _line_constraints(form, i, rhyme_word))
+        if best is not None:
+            lines.append(best.text)
+        else:
+            lines.append(_generate_line(form, theme, i, lines, rhyme_word, config))
+    
+    return lines
+
+
 def generate_poem(
     form: FormDefinition,
     theme: str,
@@ -312,6 +864,12 @@ def generate_poem(
     """
     Generate a complete poem.
     
+    Lines are generated one at a time, each seeing all prior lines, unless
+    config.parallel_workers > 1, in which case independent lines (see
+    get_generation_levels) are drafted concurrently on a thread pool. With
+    config.whole_poem, one call drafts every line and the ranker picks the
+    best option for each position.
+    
     Args:
         form: The poetic form
         theme: Theme or topic
@@ -323,33 +881,17 @@ def generate_poem(
     if config is None:
         config = get_config_from_env()
     
-    lines = []
+    if config.whole_poem:
+        return _generate_poem_whole(form, theme, config)
+    
+    if config.parallel_workers > 1:
+        return _generate_poem_parallel(form, theme, config)
+    
+    lines: List[str] = []
     
     for i in range(form.lines):
         # Determine rhyme word from prior lines and rhyme scheme
         rhyme_word = get_rhyme_word_for_line(form, i, lines)
-        
-        candidates = generate_candidates(
-            form=form,
-            theme=theme,
-            line_index=i,
-            prior_lines=lines,
-            rhyme_word=rhyme_word,
-            config=config,
-        )
-        
-        if candidates:
-            # Use ranker to pick best candidate
-            constraints = Constraints(
-                target_syllables=get_syllable_target(form, i),
-                rhyme_word=rhyme_word,
-                meter=form.meter,
-                expected_syllables=get_syllable_target(form, i) if isinstance(form.syllables, int) else 10,
-            )
-            candidate_texts = [c.text for c in candidates]
-            best = get_best_candidate(candidate_texts, constraints)
-            lines.append(best.text if best else candidates[0].text)
-        else:
-            lines.append("")
+        lines.append(_generate_line(form, theme, i, lines, rhyme_word, config))
     
     return lines
@@ -5,8 +5,10 @@ Interactive TUI for line-by-line poetry composition.
 from __future__ import annotations
 import json
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from rich.console import Console
@@ -18,9 +20,15 @@ try:
 except ImportError:
     HAS_RICH = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from sonnet.forms import FormDefinition, get_form, get_syllable_target
 from sonnet.ranker import RankedCandidate, Constraints, rank_candidates
-from sonnet.generator import generate_candidates, GenerationConfig
+from sonnet.generator import Candidate, generate_candidates, GenerationConfig
 
 
 @dataclass
@@ -32,6 +40,34 @@ class PoemProgress:
     current_line: int = 0
 
 
+# Background writer for auto-saves; one worker keeps writes in order
+_save_executor: Optional[ThreadPoolExecutor] = None
+_pending_saves: Dict[str, Future] = {}
+_save_lock = threading.Lock()
+
+
+def _write_progress(data: Dict[str, Any], path: str) -> None:
+    """Write progress data atomically via a temp file and rename."""
+    if HAS_ORJSON:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    
+    # Per process and thread, so a direct save can't clobber a background
+    # one mid-write; no fsync, the rename alone keeps the file whole
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_progress(progress: PoemProgress, path: str) -> None:
     """
     Save poem progress to a JSON file.
@@ -40,8 +76,51 @@ def save_progress(progress: PoemProgress, path: str) -> None:
         progress: Current poem state
         path: File path to save to
     """
-    with open(path, "w") as f:
-        json.dump(asdict(progress), f, indent=2)
+    _write_progress(asdict(progress), path)
+
+
+def save_progress_async(progress: PoemProgress, path: str) -> Future:
+    """
+    Save poem progress in the background.
+    
+    The state is snapshotted immediately. A queued save to the same path
+    that hasn't started yet is cancelled, since this one supersedes it.
+    
+    Args:
+        progress: Current poem state
+        path: File path to save to
+    
+    Returns:
+        Future for the write
+    """
+    global _save_executor
+    
+    data = asdict(progress)
+    with _save_lock:
+        if _save_executor is None:
+            _save_executor = ThreadPoolExecutor(max_workers=1)
+        previous = _pending_saves.get(path)
+        if previous is not None:
+            previous.cancel()
+        future = _save_executor.submit(_write_progress, data, path)
+        _pending_saves[path] = future
+    return future
+
+
+def flush_progress() -> None:
+    """
+    Wait for all background saves to finish.
+    
+    Raises:
+        OSError: If a background write failed
+    """
+    with _save_lock:
+        futures = list(_pending_saves.values())
+        _pending_saves.clear()
+    
+    for future in futures:
+        if not future.cancelled():
+            future.result()
 
 
 def load_progress(path: str) -> PoemProgress:
@@ -58,8 +137,9 @@ def load_progress(path: str) -> PoemProgress:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is invalid
     """
-    with open(path, "r") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     
     required = {"form_name", "theme", "lines"}
     if not required.issubset(data.keys()):
@@ -148,20 +228,83 @@ def get_user_selection(console: "Console", count: int) -> str:
     Returns:
         User input string (number, 'r', 'e', or 'q')
     """
+    allowed = {"r", "e", "q"} | {str(i) for i in range(1, count + 1)}
+    
     while True:
         choice = Prompt.ask("Select")
         choice = choice.strip().lower()
         
-        if choice in ("r", "e", "q"):
+        if choice in allowed:
             return choice
         
+        # Accept any spelling int() does, such as "02" or "+2"
         try:
-            num = int(choice)
-            if 1 <= num <= count:
-                return choice
-            console.print(f"[red]Please enter 1-{count}[/red]")
+            choice = str(int(choice))
         except ValueError:
             console.print("[red]Invalid input[/red]")
+            continue
+        
+        if choice in allowed:
+            return choice
+        console.print(f"[red]Please enter 1-{count}[/red]")
+
+
+class _Prefetch:
+    """
+    Candidates for a line, generated on a background thread.
+    
+    Runs on a daemon thread so a speculative request that is never used
+    doesn't hold up exit.
+    """
+    
+    def __init__(
+        self,
+        form: FormDefinition,
+        theme: str,
+        line_index: int,
+        prior_lines: List[str],
+        config: Optional[GenerationConfig],
+    ):
+        self.prior_lines = prior_lines
+        self._result: List[Candidate] = []
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(form, theme, line_index, prior_lines, config),
+            name="sonnet-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+    
+    def _run(
+        self,
+        form: FormDefinition,
+        theme: str,
+        line_index: int,
+        prior_lines: List[str],
+        config: Optional[GenerationConfig],
+    ) -> None:
+        try:
+            self._result = generate_candidates(
+                form=form,
+                theme=theme,
+                line_index=line_index,
+                prior_lines=prior_lines,
+                config=config,
+            )
+        except Exception as e:
+            self._error = e
+    
+    def running(self) -> bool:
+        """Whether generation is still in progress."""
+        return self._thread.is_alive()
+    
+    def result(self) -> List[Candidate]:
+        """Wait for the candidates, re-raising any generation error."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
 
 
 def run_interactive(
@@ -169,15 +312,21 @@ def run_interactive(
     theme: str,
     config: Optional[GenerationConfig] = None,
     save_path: Optional[str] = None,
+    prefetch: bool = True,
 ) -> List[str]:
     """
     Run the interactive TUI for poem composition.
     
+    With prefetch on, candidates for the next line are generated while
+    the user reads the current ones, assuming they'll pick the top-ranked
+    line; any other choice discards them and generates afresh.
+    
     Args:
         form: Poetic form to write
         theme: Theme or topic
         config: Generation config (uses default if None)
         save_path: Path to auto-save progress
+        prefetch: Speculatively generate the next line's candidates
     
     Returns:
         List of completed poem lines
@@ -187,6 +336,7 @@ def run_interactive(
     
     console = Console()
     lines: List[str] = []
+    speculation: Optional[_Prefetch] = None
     
     console.print(Panel(
         f"[bold]Writing a {form.name}[/bold]\nTheme: {theme}\nLines: {form.lines}",
@@ -207,14 +357,22 @@ def run_interactive(
         while True:
             # Generate candidates
             console.print("\n[dim]Generating candidates...[/dim]")
+            raw_candidates = None
+            if speculation is not None and speculation.prior_lines == lines:
+                pending, speculation = speculation, None
+                try:
+                    raw_candidates = pending.result()
+                except Exception:
+                    pass  # A failed draft just means asking again below
             try:
-                raw_candidates = generate_candidates(
-                    form=form,
-                    theme=theme,
-                    line_index=line_idx,
-                    prior_lines=lines,
-                    config=config,
-                )
+                if raw_candidates is None:
+                    raw_candidates = generate_candidates(
+                        form=form,
+                        theme=theme,
+                        line_index=line_idx,
+                        prior_lines=lines,
+                        config=config,
+                    )
                 candidate_texts = [c.text for c in raw_candidates]
             except Exception as e:
                 console.print(f"[red]Generation failed: {e}[/red]")
@@ -228,16 +386,26 @@ def run_interactive(
                 break
             
             # Rank candidates
-            ranked = rank_candidates(candidate_texts, constraints)
+            ranked = rank_candidates(candidate_texts, constraints, limit=5)
             display_candidates(console, ranked)
             
+            # Draft the next line while the user decides; a discarded
+            # draft still in flight (e.g. after regenerating) blocks a new
+            # one, so there's never more than one speculative request
+            busy = speculation is not None and speculation.running()
+            if prefetch and line_idx + 1 < form.lines and not busy:
+                speculation = _Prefetch(
+                    form, theme, line_idx + 1, lines + [ranked[0].text], config
+                )
+            
             choice = get_user_selection(console, len(ranked))
             
             if choice == "q":
                 console.print("[yellow]Saving and exiting...[/yellow]")
                 if save_path:
-                    progress = PoemProgress(form.name, theme, lines, line_idx)
-                    save_progress(progress, save_path)
+                    # Let queued autosaves land first so none overwrites this
+                    flush_progress()
+                    save_progress(PoemProgress(form.name, theme, lines, line_idx), save_path)
                 return lines
             elif choice == "r":
                 continue  # Regenerate
@@ -250,10 +418,13 @@ def run_interactive(
                 lines.append(ranked[idx].text)
                 break
         
-        # Auto-save after each line
+        # Auto-save after each line, off the prompt loop
         if save_path:
             progress = PoemProgress(form.name, theme, lines, line_idx + 1)
-            save_progress(progress, save_path)
+            save_progress_async(progress, save_path)
+    
+    if save_path:
+        flush_progress()
     
     # Complete!
     console.print("\n[bold green]Poem complete![/bold green]\n")
@@ -1,7 +1,9 @@
 """Meter scanning and pattern matching."""
 
 import re
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
 
 from sonnet.syllables import get_phonemes, count_syllables
@@ -16,6 +18,10 @@ class MeterType(Enum):
     SPONDAIC = "spondaic"    # DUM-DUM (//)
 
 
+# Word tokens for scanning (letters, apostrophes, hyphens)
+_WORD_RE = re.compile(r"[a-zA-Z'-]+")
+
+
 # Meter patterns (u = unstressed, / = stressed)
 METER_PATTERNS = {
     MeterType.IAMBIC: "u/",
@@ -26,24 +32,43 @@ METER_PATTERNS = {
 }
 
 
+@lru_cache(maxsize=None)
+def parse_meter(name: Optional[str]) -> Optional[MeterType]:
+    """
+    Map a meter name like "iambic" or "Iambic" to its MeterType.
+    
+    Returns None for empty or unknown names. Cached, since forms and
+    rankers resolve the same handful of names over and over.
+    """
+    if not name:
+        return None
+    try:
+        return MeterType(name.lower())
+    except ValueError:
+        return None
+
+
+# Joined phonemes -> stress pattern: keep only the vowels' stress digits,
+# as 'u' (0) or '/' (1, 2)
+_STRESS_DIGITS = str.maketrans(
+    {**dict.fromkeys(map(chr, range(128))), "0": "u", "1": "/", "2": "/"}
+)
+
+
+@lru_cache(maxsize=4096)
 def get_word_stress(word: str) -> str:
     """
     Get stress pattern for a word.
     
     Returns string of 'u' (unstressed) and '/' (stressed).
     Uses CMU dictionary if available, else heuristic.
+    Results are cached per word.
     """
     phonemes = get_phonemes(word)
     
     if phonemes:
-        pattern = ""
-        for p in phonemes:
-            if p[-1].isdigit():
-                stress = int(p[-1])
-                if stress == 0:
-                    pattern += "u"
-                else:
-                    pattern += "/"
+        # Vowel phonemes end in a stress digit: 0 unstressed, 1/2 stressed
+        pattern = "".join(phonemes).translate(_STRESS_DIGITS)
         return pattern if pattern else "u"
     
     # Heuristic fallback: alternate u/ starting with u
@@ -51,41 +76,34 @@ def get_word_stress(word: str) -> str:
     if syllables <= 1:
         return "u"  # Single syllable words are often unstressed
     
-    # Common pattern: stress on first syllable for 2-syllable words
-    pattern = ""
-    for i in range(syllables):
-        if i == 0:
-            pattern += "/"  # First syllable stressed (common in English)
-        else:
-            pattern += "u"
-    return pattern
+    # Common pattern: stress on first syllable (common in English)
+    return "/" + "u" * (syllables - 1)
 
 
+@lru_cache(maxsize=1024)
 def scan_line(line: str) -> str:
     """
     Scan a line of poetry for its stress pattern.
     
     Returns string of 'u' (unstressed) and '/' (stressed).
+    Cached per line, since ranking and checking rescan the same candidates.
     """
     if not line:
         return ""
     
     # Extract words
-    words = re.findall(r"[a-zA-Z'-]+", line)
+    words = _WORD_RE.findall(line)
     
-    pattern = ""
-    for word in words:
-        word_pattern = get_word_stress(word)
-        pattern += word_pattern
-    
-    return pattern
+    return "".join([get_word_stress(word) for word in words])
 
 
+@lru_cache(maxsize=64)
 def get_expected_pattern(meter: MeterType, syllables: int) -> str:
     """
     Generate expected stress pattern for a given meter and syllable count.
     
     For iambic pentameter (10 syllables): u/u/u/u/u/
+    Cached, since every candidate line for a form asks for the same one.
     """
     base = METER_PATTERNS[meter]
     base_len = len(base)
@@ -97,23 +115,43 @@ def get_expected_pattern(meter: MeterType, syllables: int) -> str:
     return full_pattern[:syllables]
 
 
+# Stress pattern -> binary digits ('/' = 1, 'u' = 0)
+_STRESS_BITS = str.maketrans("u/", "01")
+
+# Number of set bits in an int; int.bit_count only exists on 3.10+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+    def _popcount(n: int) -> int:
+        return bin(n).count("1")
+
+
+@lru_cache(maxsize=1024)
+def _pack_pattern(pattern: str) -> int:
+    """Pack a 'u'/'/' stress pattern into an int, first syllable highest."""
+    return int(pattern.translate(_STRESS_BITS), 2)
+
+
 def _pattern_similarity(actual: str, expected: str) -> float:
     """
     Calculate similarity between two stress patterns.
     
+    Both patterns are packed into ints and compared with a single XOR;
+    the shorter one is padded with unstressed syllables.
+    
     Returns 0-1 score.
     """
     if not actual or not expected:
         return 0.0
     
-    # Pad shorter pattern
+    # Padding with 'u' appends zero bits, i.e. shifts left
     max_len = max(len(actual), len(expected))
-    actual = actual.ljust(max_len, "u")
-    expected = expected.ljust(max_len, "u")
+    actual_bits = _pack_pattern(actual) << (max_len - len(actual))
+    expected_bits = _pack_pattern(expected) << (max_len - len(expected))
     
-    # Count matches
-    matches = sum(1 for a, e in zip(actual, expected) if a == e)
-    return matches / max_len
+    # Matching syllables are the zero bits of the XOR
+    mismatches = _popcount(actual_bits ^ expected_bits)
+    return (max_len - mismatches) / max_len
 
 
 def match_meter(
@@ -159,3 +197,10 @@ def describe_meter(meter: MeterType, feet: int = 5) -> str:
     
     foot_name = names.get(feet, f"{feet}-meter")
     return f"{meter.value} {foot_name}"
+
+
+def clear_caches() -> None:
+    """Clear the per-word and per-line stress caches in this module."""
+    get_word_stress.cache_clear()
+    scan_line.cache_clear()
+    _pack_pattern.cache_clear()
@@ -3,15 +3,26 @@ Candidate ranking by constraint satisfaction.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import heapq
+import sys
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Dict, Any
 
 from sonnet.syllables import count_line_syllables
 from sonnet.rhymes import check_rhyme, RhymeType
-from sonnet.meter import match_meter, MeterType
+from sonnet.meter import match_meter, parse_meter
 
 
-@dataclass
+# Weights of each constraint in RankingScore.total (sum to 1.0)
+SYLLABLE_WEIGHT = 0.4
+RHYME_WEIGHT = 0.35
+METER_WEIGHT = 0.25
+
+# One score is built per candidate; skip the per-instance __dict__ where supported
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RankingScore:
     """Breakdown of constraint scores for a candidate."""
     syllable_score: float = 1.0  # 0-1
@@ -21,11 +32,10 @@ class RankingScore:
     @property
     def total(self) -> float:
         """Weighted total score."""
-        weights = {"syllable": 0.4, "rhyme": 0.35, "meter": 0.25}
         return (
-            self.syllable_score * weights["syllable"] +
-            self.rhyme_score * weights["rhyme"] +
-            self.meter_score * weights["meter"]
+            self.syllable_score * SYLLABLE_WEIGHT +
+            self.rhyme_score * RHYME_WEIGHT +
+            self.meter_score * METER_WEIGHT
         )
 
 
@@ -46,18 +56,6 @@ class Constraints:
     expected_syllables: int = 10   # For meter matching
 
 
-def _meter_type_from_string(meter: str) -> Optional[MeterType]:
-    """Convert meter string to MeterType enum."""
-    mapping = {
-        "iambic": MeterType.IAMBIC,
-        "trochaic": MeterType.TROCHAIC,
-        "anapestic": MeterType.ANAPESTIC,
-        "dactylic": MeterType.DACTYLIC,
-        "spondaic": MeterType.SPONDAIC,
-    }
-    return mapping.get(meter.lower()) if meter else None
-
-
 def score_syllables(text: str, target: int, tolerance: int = 1) -> float:
     """
     Score a line based on syllable count.
@@ -133,7 +131,7 @@ def score_meter(
     if not meter:
         return 1.0
     
-    meter_type = _meter_type_from_string(meter)
+    meter_type = parse_meter(meter)
     if not meter_type:
         return 1.0
     
@@ -165,9 +163,55 @@ def score_candidate(
     )
 
 
+def score_candidates(
+    candidates: List[str],
+    constraints: Constraints,
+) -> List[RankingScore]:
+    """
+    Score many candidate lines, one constraint at a time.
+    
+    Equivalent to calling score_candidate on each line, but each
+    constraint is resolved once for the whole batch and skipped
+    entirely (scored 1.0) when it doesn't apply.
+    
+    Args:
+        candidates: Candidate lines
+        constraints: Constraint requirements
+    
+    Returns:
+        RankingScore for each candidate, in input order
+    """
+    count = len(candidates)
+    
+    target = constraints.target_syllables
+    if target:
+        syllable_scores = [score_syllables(text, target) for text in candidates]
+    else:
+        syllable_scores = [1.0] * count
+    
+    rhyme_word = constraints.rhyme_word
+    if rhyme_word:
+        rhyme_scores = [score_rhyme(text, rhyme_word) for text in candidates]
+    else:
+        rhyme_scores = [1.0] * count
+    
+    meter_type = parse_meter(constraints.meter)
+    if meter_type:
+        expected = constraints.expected_syllables
+        meter_scores = [match_meter(text, meter_type, expected) for text in candidates]
+    else:
+        meter_scores = [1.0] * count
+    
+    return [
+        RankingScore(syllable_score=syl, rhyme_score=rhyme, meter_score=meter)
+        for syl, rhyme, meter in zip(syllable_scores, rhyme_scores, meter_scores)
+    ]
+
+
 def rank_candidates(
     candidates: List[str],
     constraints: Constraints,
+    limit: Optional[int] = None,
 ) -> List[RankedCandidate]:
     """
     Rank a list of candidates by constraint satisfaction.
@@ -175,17 +219,21 @@ def rank_candidates(
     Args:
         candidates: List of candidate lines
         constraints: Constraint requirements
+        limit: Only return the best `limit` candidates (all if None)
     
     Returns:
         List of RankedCandidate sorted by score (best first)
     """
-    scored = []
-    for text in candidates:
-        score = score_candidate(text, constraints)
-        scored.append(RankedCandidate(text=text, score=score))
+    scored = [
+        RankedCandidate(text=text, score=score)
+        for text, score in zip(candidates, score_candidates(candidates, constraints))
+    ]
     
-    # Sort by total score, descending
-    scored.sort(key=lambda c: c.score.total, reverse=True)
+    # Sort by total score, descending (ties keep input order)
+    if limit is not None and limit < len(scored):
+        scored = heapq.nlargest(limit, scored, key=lambda c: c.score.total)
+    else:
+        scored.sort(key=lambda c: c.score.total, reverse=True)
     
     # Assign ranks
     for i, candidate in enumerate(scored):
@@ -201,6 +249,10 @@ def get_best_candidate(
     """
     Get the best scoring candidate.
     
+    Picks the same candidate as rank_candidates, but skips the meter scan
+    for any candidate that couldn't beat the current best even with a
+    perfect meter score, and stops at the first perfect candidate.
+    
     Args:
         candidates: List of candidate lines
         constraints: Constraint requirements
@@ -208,5 +260,29 @@ def get_best_candidate(
     Returns:
         Best RankedCandidate or None if no candidates
     """
-    ranked = rank_candidates(candidates, constraints)
-    return ranked[0] if ranked else None
+    meter_type = parse_meter(constraints.meter)
+    best: Optional[RankedCandidate] = None
+    best_total = -1.0
+    
+    for text in candidates:
+        score = RankingScore(
+            syllable_score=score_syllables(text, constraints.target_syllables),
+            rhyme_score=score_rhyme(text, constraints.rhyme_word),
+        )
+        # meter_score defaults to 1.0, so this is an upper bound
+        if score.total <= best_total:
+            continue
+        if meter_type:
+            score = replace(
+                score,
+                meter_score=match_meter(text, meter_type, constraints.expected_syllables),
+            )
+        
+        total = score.total
+        if total > best_total:
+            best = RankedCandidate(text=text, score=score, rank=1)
+            best_total = total
+            if total >= 1.0:
+                break
+    
+    return best
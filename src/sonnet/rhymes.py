@@ -1,9 +1,15 @@
 """Rhyme detection using phoneme matching."""
 
+import heapq
+import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sonnet import syllables
 from sonnet.syllables import get_phonemes, get_cmu_dict
+from sonnet.forms import parse_rhyme_scheme
 
 
 class RhymeType(Enum):
@@ -13,12 +19,18 @@ class RhymeType(Enum):
     NONE = "none"
 
 
+# Words within a line
+_WORD_RE = re.compile(r"[a-zA-Z'-]+")
+
+# ASCII characters that can't be part of a _WORD_RE word
+_NON_WORD_ASCII = "".join(c for c in map(chr, range(128)) if not _WORD_RE.match(c))
+
 # Vowel phonemes (those that carry stress markers)
-VOWEL_PHONEMES = {
+VOWEL_PHONEMES = frozenset({
     "AA", "AE", "AH", "AO", "AW", "AY", 
     "EH", "ER", "EY", "IH", "IY", 
     "OW", "OY", "UH", "UW"
-}
+})
 
 
 def _strip_stress(phoneme: str) -> str:
@@ -34,66 +46,82 @@ def _is_vowel(phoneme: str) -> bool:
     return base in VOWEL_PHONEMES
 
 
-def get_rhyme_phonemes(word: str) -> Optional[List[str]]:
+class _PhonemeTable(dict):
+    """Memoizes a per-phoneme function; the dictionary has ~80 distinct phonemes."""
+    
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+    
+    def __missing__(self, phoneme: str):
+        value = self[phoneme] = self.func(phoneme)
+        return value
+
+
+# Lookup tables for the hot loops, filled in as phonemes are seen
+_BASE_PHONEME = _PhonemeTable(_strip_stress)
+_IS_VOWEL = _PhonemeTable(_is_vowel)
+
+
+@lru_cache(maxsize=8192)
+def get_rhyme_phonemes(word: str) -> Optional[Tuple[str, ...]]:
     """
     Get the phonemes from the last stressed vowel to end of word.
     
     This is the part that determines rhyme.
-    Returns None if word not in dictionary.
+    Returns None if word not in dictionary. Results are cached per word.
     """
     phonemes = get_phonemes(word)
     if phonemes is None:
         return None
     
-    # Find the last stressed vowel (stress = 1 or 2)
-    last_stressed_idx = -1
-    for i, p in enumerate(phonemes):
-        if p[-1] in "12":  # Primary or secondary stress
-            last_stressed_idx = i
+    tail = _rhyme_tail(phonemes)
+    return tuple(tail) if tail is not None else None
+
+
+def _rhyme_tail(phonemes: List[str]) -> Optional[List[str]]:
+    """Phonemes from the last stressed (else last) vowel to the end."""
+    # Scan backwards for the last stressed vowel (stress = 1 or 2)
+    for i in range(len(phonemes) - 1, -1, -1):
+        if phonemes[i][-1] in "12":  # Primary or secondary stress
+            return phonemes[i:]
     
     # If no stressed vowel found, use last vowel
-    if last_stressed_idx == -1:
-        for i, p in enumerate(phonemes):
-            if _is_vowel(p):
-                last_stressed_idx = i
+    for i in range(len(phonemes) - 1, -1, -1):
+        if _IS_VOWEL[phonemes[i]]:
+            return phonemes[i:]
     
-    if last_stressed_idx == -1:
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _stripped_rhyme(word: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Stress-stripped rhyme tail and its vowels, or None if unknown (cached)."""
+    rhyme = get_rhyme_phonemes(word)
+    if rhyme is None:
         return None
     
-    return phonemes[last_stressed_idx:]
+    tail = tuple(map(_BASE_PHONEME.__getitem__, rhyme))
+    vowels = tuple([p for p in tail if p in VOWEL_PHONEMES])
+    return tail, vowels
 
 
-def check_rhyme(word1: str, word2: str) -> RhymeType:
-    """
-    Check if two words rhyme.
-    
-    Returns:
-        RhymeType.PERFECT: Exact match of rhyme phonemes
-        RhymeType.SLANT: Vowels match but consonants may differ
-        RhymeType.NONE: No rhyme detected
-    """
-    # Same word rhymes with itself
-    if word1.lower().strip() == word2.lower().strip():
-        return RhymeType.PERFECT
-    
-    rhyme1 = get_rhyme_phonemes(word1)
-    rhyme2 = get_rhyme_phonemes(word2)
-    
+def _compare_rhymes(
+    rhyme1: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+    rhyme2: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+) -> RhymeType:
+    """Classify two _stripped_rhyme results."""
     if rhyme1 is None or rhyme2 is None:
         return RhymeType.NONE
     
-    # Strip stress for comparison
-    stripped1 = [_strip_stress(p) for p in rhyme1]
-    stripped2 = [_strip_stress(p) for p in rhyme2]
+    stripped1, vowels1 = rhyme1
+    stripped2, vowels2 = rhyme2
     
     # Perfect rhyme: exact match of rhyme portion
     if stripped1 == stripped2:
         return RhymeType.PERFECT
     
     # Slant rhyme: vowels match, consonants may differ
-    vowels1 = [p for p in stripped1 if p in VOWEL_PHONEMES]
-    vowels2 = [p for p in stripped2 if p in VOWEL_PHONEMES]
-    
     if vowels1 and vowels2 and vowels1 == vowels2:
         return RhymeType.SLANT
     
@@ -105,6 +133,22 @@ def check_rhyme(word1: str, word2: str) -> RhymeType:
     return RhymeType.NONE
 
 
+def check_rhyme(word1: str, word2: str) -> RhymeType:
+    """
+    Check if two words rhyme.
+    
+    Returns:
+        RhymeType.PERFECT: Exact match of rhyme phonemes
+        RhymeType.SLANT: Vowels match but consonants may differ
+        RhymeType.NONE: No rhyme detected
+    """
+    # Same word rhymes with itself
+    if word1.lower().strip() == word2.lower().strip():
+        return RhymeType.PERFECT
+    
+    return _compare_rhymes(_stripped_rhyme(word1), _stripped_rhyme(word2))
+
+
 def find_rhymes(
     word: str, 
     candidates: List[str], 
@@ -118,24 +162,38 @@ def find_rhymes(
     if not word or not candidates:
         return []
     
-    results = []
+    # Look the target up once rather than per candidate
+    target_key = word.lower().strip()
+    target = _stripped_rhyme(word)
+    
+    perfect = []
+    slant = []
     for candidate in candidates:
-        rhyme_type = check_rhyme(word, candidate)
+        if candidate.lower().strip() == target_key:
+            rhyme_type = RhymeType.PERFECT
+        else:
+            rhyme_type = _compare_rhymes(target, _stripped_rhyme(candidate))
+        
         if rhyme_type == RhymeType.PERFECT:
-            results.append((candidate, rhyme_type))
+            perfect.append((candidate, rhyme_type))
         elif include_slant and rhyme_type == RhymeType.SLANT:
-            results.append((candidate, rhyme_type))
+            slant.append((candidate, rhyme_type))
     
-    # Sort: perfect rhymes first
-    results.sort(key=lambda x: 0 if x[1] == RhymeType.PERFECT else 1)
-    
-    return results
+    # Perfect rhymes first, each group in candidate order
+    return perfect + slant
 
 
+@lru_cache(maxsize=1024)
 def get_last_word(line: str) -> str:
-    """Extract the last word from a line (for rhyme checking)."""
-    import re
-    words = re.findall(r"[a-zA-Z'-]+", line)
+    """Extract the last word from a line (for rhyme checking, cached per line)."""
+    # Usually the last space-separated token, minus trailing punctuation,
+    # is the word; check that before tokenizing the whole line
+    stripped = line.rstrip(_NON_WORD_ASCII)
+    tail = stripped[stripped.rfind(" ") + 1:]
+    if _WORD_RE.fullmatch(tail):
+        return tail
+    
+    words = _WORD_RE.findall(line)
     return words[-1] if words else ""
 
 
@@ -144,14 +202,86 @@ def get_rhyme_groups(scheme: str) -> dict:
     Parse a rhyme scheme string into groups.
     
     E.g., "ABAB" -> {"A": [0, 2], "B": [1, 3]}
+    
+    Unlike forms.get_rhyme_groups, non-letters (such as the spaces in
+    "ABA ABA") don't form a group, though they still take up a position.
     """
-    groups = {}
-    for i, letter in enumerate(scheme.upper()):
-        if letter.isalpha():
-            if letter not in groups:
-                groups[letter] = []
-            groups[letter].append(i)
-    return groups
+    return {
+        letter: list(indices)
+        for letter, indices in parse_rhyme_scheme(scheme)
+        if letter.isalpha()
+    }
+
+
+@dataclass(frozen=True)
+class RhymeIndex:
+    """
+    Precomputed rhyme data for every plain-alphabetic CMU dictionary word.
+    
+    Rhyme tails and vowel sequences are stress-stripped, so perfect and
+    slant rhyme candidates can be found with dict lookups instead of a
+    scan of the whole dictionary. Each bucket is sorted by (syllable
+    count, word), the order suggest_rhymes returns results in.
+    """
+    tails: Dict[str, Tuple[str, ...]]
+    syllables: Dict[str, int]
+    by_tail: Dict[Tuple[str, ...], List[str]]
+    by_vowels: Dict[Tuple[str, ...], List[str]]
+    by_last: Dict[str, List[str]]
+
+
+# Module-level cache for the rhyme index
+_RHYME_INDEX: Optional[RhymeIndex] = None
+
+
+def _build_rhyme_index() -> RhymeIndex:
+    """Index the first pronunciation of each alphabetic dictionary word."""
+    is_syllable = _PhonemeTable(lambda p: p[-1].isdigit())
+    
+    tails: Dict[str, Tuple[str, ...]] = {}
+    vowel_seqs: Dict[str, Tuple[str, ...]] = {}
+    counts: Dict[str, int] = {}
+    
+    for word, pronunciations in get_cmu_dict().items():
+        if not word.isalpha():
+            continue
+        
+        phonemes = pronunciations[0]
+        rhyme = _rhyme_tail(phonemes)
+        if rhyme is None:
+            continue
+        
+        tail = tuple(map(_BASE_PHONEME.__getitem__, rhyme))
+        tails[word] = tail
+        vowel_seqs[word] = tuple([p for p in tail if p in VOWEL_PHONEMES])
+        counts[word] = sum(map(is_syllable.__getitem__, phonemes))
+    
+    # Fill buckets in (syllable count, word) order so each comes out sorted;
+    # sorting by word then stably by count avoids building tuple keys
+    ordered = sorted(tails)
+    ordered.sort(key=counts.__getitem__)
+    
+    by_tail: Dict[Tuple[str, ...], List[str]] = {}
+    by_vowels: Dict[Tuple[str, ...], List[str]] = {}
+    by_last: Dict[str, List[str]] = {}
+    
+    for word in ordered:
+        tail = tails[word]
+        by_tail.setdefault(tail, []).append(word)
+        vowels = vowel_seqs[word]
+        if vowels:
+            by_vowels.setdefault(vowels, []).append(word)
+        by_last.setdefault(tail[-1], []).append(word)
+    
+    return RhymeIndex(tails, counts, by_tail, by_vowels, by_last)
+
+
+def get_rhyme_index() -> RhymeIndex:
+    """Get the rhyme index, building it on first use (cached)."""
+    global _RHYME_INDEX
+    if _RHYME_INDEX is None:
+        _RHYME_INDEX = _build_rhyme_index()
+    return _RHYME_INDEX
 
 
 def suggest_rhymes(
@@ -174,76 +304,67 @@ def suggest_rhymes(
     Returns:
         List of (word, rhyme_type, syllable_count) tuples, sorted by quality
     """
-    from sonnet.syllables import count_syllables
-    
-    cmu = get_cmu_dict()
-    if not cmu:
+    target = _stripped_rhyme(word)
+    if target is None:
         return []
     
-    target_rhyme = get_rhyme_phonemes(word)
-    if target_rhyme is None:
-        return []
+    index = get_rhyme_index()
+    target_stripped, target_vowels = target
+    word_lower = word.lower().strip()
     
-    target_stripped = [_strip_stress(p) for p in target_rhyme]
-    target_vowels = [p for p in target_stripped if p in VOWEL_PHONEMES]
+    def order(candidate: str) -> Tuple[int, str]:
+        return (index.syllables[candidate], candidate)
     
-    results = []
-    word_lower = word.lower().strip()
+    # Perfect rhymes share the whole tail
+    perfect = index.by_tail.get(target_stripped, [])
     
-    for candidate in cmu.keys():
-        # Skip the word itself
-        if candidate.lower() == word_lower:
-            continue
-        
-        # Skip words with numbers or special chars
-        if not candidate.isalpha():
-            continue
-        
-        candidate_rhyme = get_rhyme_phonemes(candidate)
-        if candidate_rhyme is None:
-            continue
-        
-        candidate_stripped = [_strip_stress(p) for p in candidate_rhyme]
+    # Slant rhymes share the vowels or the final phoneme. Both buckets are
+    # already in result order, so merge them lazily; a word in both comes
+    # out twice in a row.
+    slant: Iterable[str] = ()
+    if include_slant:
+        by_vowels = index.by_vowels.get(target_vowels, []) if target_vowels else []
+        by_last = index.by_last.get(target_stripped[-1], [])
+        slant = heapq.merge(by_vowels, by_last, key=order)
+    
+    results = []
+    perfect_words = None
+    previous = None
+    for candidates, rhyme_type in ((perfect, RhymeType.PERFECT), (slant, RhymeType.SLANT)):
+        if rhyme_type == RhymeType.SLANT:
+            perfect_words = set(perfect)
         
-        # Check for perfect rhyme
-        if candidate_stripped == target_stripped:
-            syllables = count_syllables(candidate)
+        for candidate in candidates:
+            if len(results) >= max_results:
+                return results
+            
+            # Skip the word itself
+            if candidate == word_lower:
+                continue
             
-            # Apply syllable filters
+            if perfect_words is not None:
+                if candidate == previous or candidate in perfect_words:
+                    continue
+                previous = candidate
+            
+            syllables = index.syllables[candidate]
+            
+            # Apply syllable filters; buckets are sorted by syllable count
             if min_syllables and syllables < min_syllables:
                 continue
             if max_syllables and syllables > max_syllables:
-                continue
-                
-            results.append((candidate, RhymeType.PERFECT, syllables))
-            continue
-        
-        # Check for slant rhyme if enabled
-        if include_slant:
-            candidate_vowels = [p for p in candidate_stripped if p in VOWEL_PHONEMES]
+                break
             
-            is_slant = False
-            # Vowels match
-            if target_vowels and candidate_vowels and target_vowels == candidate_vowels:
-                is_slant = True
-            # Last consonant matches
-            elif len(target_stripped) >= 1 and len(candidate_stripped) >= 1:
-                if target_stripped[-1] == candidate_stripped[-1]:
-                    is_slant = True
-            
-            if is_slant:
-                syllables = count_syllables(candidate)
-                if min_syllables and syllables < min_syllables:
-                    continue
-                if max_syllables and syllables > max_syllables:
-                    continue
-                results.append((candidate, RhymeType.SLANT, syllables))
-    
-    # Sort: perfect first, then by syllable count, then alphabetically
-    results.sort(key=lambda x: (
-        0 if x[1] == RhymeType.PERFECT else 1,
-        x[2],  # syllable count
-        x[0],  # alphabetically
-    ))
+            results.append((candidate, rhyme_type, syllables))
     
     return results[:max_results]
+
+
+def clear_caches() -> None:
+    """Clear the rhyme caches, including the per-word syllable caches."""
+    global _RHYME_INDEX
+    syllables.clear_caches()
+    get_rhyme_phonemes.cache_clear()
+    _stripped_rhyme.cache_clear()
+    get_last_word.cache_clear()
+    _RHYME_INDEX = None
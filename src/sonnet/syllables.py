@@ -1,94 +1,252 @@
 """Syllable counting using CMU Pronouncing Dictionary and heuristics."""
 
+import gc
+import marshal
 import os
 import re
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 # Module-level cache for CMU dictionary
 _CMU_DICT: Optional[Dict[str, List[List[str]]]] = None
 
+# Held while the dictionary loads, so concurrent callers wait for one load
+_CMU_LOCK = threading.Lock()
+
+# Bump when the parsed dictionary layout changes, to invalidate caches
+_CMU_CACHE_VERSION = 2
+
+# Where the parsed-dictionary cache lives; the package data directory
+# belongs to the installer and is only ever read
+_USER_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "sonnet"
+
+# Characters dropped from a word before dictionary lookup
+_NON_WORD_RE = re.compile(r"[^\w'-]")
+
+# Characters dropped from a word before heuristic counting
+_NON_LETTER_RE = re.compile(r"[^a-z]")
+
+# str.translate equivalents of the above for ASCII input, which skip the
+# regex engine on the per-word hot path
+_NON_WORD_ASCII = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _NON_WORD_RE.match(c))
+)
+_NON_LETTER_ASCII = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _NON_LETTER_RE.match(c))
+)
+
+# Consonant bytes -> spaces, so the vowel groups of a letters-only word
+# are the fields of word.encode().translate(_CONSONANTS_TO_SPACE).split()
+_CONSONANTS_TO_SPACE = bytes(
+    0x20 if chr(b) in "bcdfghjklmnpqrstvwxz" else b for b in range(256)
+)
+
+# Resolved dictionary location, set by _get_data_path
+_DATA_PATH: Optional[Path] = None
+
+# Alternate pronunciation suffix: word(2), word(3), ...
+_VARIANT_RE = re.compile(r"\(\d+\)$")
+
+# Words within a line
+_WORD_RE = re.compile(r"[a-zA-Z'-]+")
+
 
 def _get_data_path() -> Path:
-    """Get path to data directory."""
+    """Get path to the CMU dictionary file (cached once found)."""
+    global _DATA_PATH
+    if _DATA_PATH is not None:
+        return _DATA_PATH
+    
     # Try relative to this file first
     pkg_dir = Path(__file__).parent.parent.parent
     data_path = pkg_dir / "data" / "cmudict.txt"
     if data_path.exists():
+        _DATA_PATH = data_path
         return data_path
     
-    # Try installed package location
+    # Try installed package location. files() hands back a plain Path for
+    # packages on the filesystem, so no as_file() extraction is needed.
     import importlib.resources as pkg_resources
     try:
-        with pkg_resources.files("sonnet").joinpath("data/cmudict.txt") as p:
-            if p.exists():
-                return Path(p)
+        resource = pkg_resources.files("sonnet").joinpath("data/cmudict.txt")
     except (AttributeError, TypeError):
-        pass
+        resource = None
+    if isinstance(resource, Path) and resource.is_file():
+        _DATA_PATH = resource
+        return resource
     
     # Fallback to current directory
     return Path("data/cmudict.txt")
 
 
+def _cmu_cache_path(data_path: Path) -> Path:
+    """Location of the parsed-dictionary cache for data_path."""
+    return _USER_CACHE_DIR / f"{data_path.name}.marshal"
+
+
+def _cmu_cache_header(data_path: Path) -> tuple:
+    """Identify the source file and interpreter a cache was built for."""
+    stat = data_path.stat()
+    return (
+        _CMU_CACHE_VERSION,
+        marshal.version,
+        sys.version_info[:2],
+        str(data_path.resolve()),
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+
+
+def _read_cmu_cache(data_path: Path) -> Optional[Dict[str, List[List[str]]]]:
+    """Load the parsed dictionary from a cache matching data_path, if any."""
+    try:
+        # loads() on the whole buffer is far faster than load(f)
+        with open(_cmu_cache_path(data_path), "rb") as f:
+            cached_header, result = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_header != _cmu_cache_header(data_path):
+        return None
+    return result
+
+
+def _write_cmu_cache(data_path: Path, result: Dict[str, List[List[str]]]) -> None:
+    """Save the parsed dictionary to the user cache directory, if writable."""
+    payload = marshal.dumps((_cmu_cache_header(data_path), result))
+    cache_path = _cmu_cache_path(data_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def _load_cmu_dict() -> Dict[str, List[List[str]]]:
     """
     Load and parse CMU Pronouncing Dictionary.
     
+    The parsed result is cached in marshal format under ~/.cache/sonnet
+    (or $XDG_CACHE_HOME/sonnet) and reused while the text file is
+    unchanged.
+    
     Returns dict mapping lowercase word to list of pronunciations,
     where each pronunciation is a list of phonemes.
     """
-    result: Dict[str, List[List[str]]] = {}
     data_path = _get_data_path()
     
     if not data_path.exists():
-        return result
-    
-    with open(data_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith(";;;"):
-                continue
-            
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-            
-            word = parts[0].lower()
-            phonemes = parts[1:]
-            
-            # Handle alternate pronunciations: word(2), word(3), etc.
-            # Strip the (N) suffix to get base word
-            base_word = re.sub(r"\(\d+\)$", "", word)
-            
-            if base_word not in result:
-                result[base_word] = []
-            result[base_word].append(phonemes)
+        return {}
+    
+    result = _read_cmu_cache(data_path)
+    if result is None:
+        result = _parse_cmu_dict(data_path)
+        _write_cmu_cache(data_path, result)
+    
+    return result
+
+
+def _parse_cmu_dict(data_path: Path) -> Dict[str, List[List[str]]]:
+    """Parse the CMU dictionary text file."""
+    result: Dict[str, List[List[str]]] = {}
+    
+    # Decode the whole file in one go rather than line by line through a
+    # text wrapper; split() below takes care of stray whitespace
+    with open(data_path, "rb") as f:
+        text = f.read().decode("utf-8")
+    
+    for line in text.splitlines():
+        parts = line.split(None, 1)
+        if len(parts) < 2 or parts[0].startswith(";;;"):
+            continue
+        
+        word = parts[0].lower()
+        # ~70 distinct phonemes across ~900k tokens: intern them so
+        # every pronunciation shares the same string objects
+        phonemes = list(map(sys.intern, parts[1].split()))
+        
+        # Handle alternate pronunciations: word(2), word(3), etc.
+        # Strip the (N) suffix to get base word; only ~7% of lines
+        # have one, so skip the regex for the rest
+        if word.endswith(")"):
+            word = _VARIANT_RE.sub("", word)
+        
+        pronunciations = result.get(word)
+        if pronunciations is None:
+            result[word] = [phonemes]
+        else:
+            pronunciations.append(phonemes)
     
     return result
 
 
 def get_cmu_dict() -> Dict[str, List[List[str]]]:
-    """Get CMU dictionary, loading if necessary (cached)."""
+    """
+    Get CMU dictionary, loading if necessary (cached).
+    
+    Thread-safe: if another thread (such as a preload) is
+    already loading it, this waits for that load instead of starting a
+    second one.
+    """
     global _CMU_DICT
     if _CMU_DICT is None:
-        _CMU_DICT = _load_cmu_dict()
+        with _CMU_LOCK:
+            if _CMU_DICT is None:
+                # Loading allocates ~600k small objects; cyclic GC passes
+                # over them are pure overhead, so pause it. The switch is
+                # process-wide, so it's only touched while holding the lock.
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    _CMU_DICT = _load_cmu_dict()
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
     return _CMU_DICT
 
 
+def preload_cmu_dict() -> threading.Thread:
+    """
+    Start loading the CMU dictionary on a background daemon thread.
+    
+    Returns:
+        The started thread
+    """
+    thread = threading.Thread(target=get_cmu_dict, name="sonnet-cmu-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache(maxsize=8192)
 def get_phonemes(word: str) -> Optional[List[str]]:
     """
     Get phonemes for a word from CMU dictionary.
     
     Returns first pronunciation if multiple exist, or None if not found.
+    Results are cached per word and shared with the dictionary, so
+    callers must not modify the returned list.
     """
     cmu = get_cmu_dict()
-    clean_word = re.sub(r"[^\w'-]", "", word.lower())
+    word = word.lower()
+    if word.isascii():
+        clean_word = word.translate(_NON_WORD_ASCII)
+    else:
+        clean_word = _NON_WORD_RE.sub("", word)
     
     if clean_word in cmu:
         return cmu[clean_word][0]
     return None
 
 
+@lru_cache(maxsize=8192)
 def count_syllables_cmu(word: str) -> Optional[int]:
     """
     Count syllables using CMU dictionary.
@@ -105,6 +263,7 @@ def count_syllables_cmu(word: str) -> Optional[int]:
     return count
 
 
+@lru_cache(maxsize=8192)
 def _heuristic_count(word: str) -> int:
     """
     Count syllables using heuristic rules (fallback for unknown words).
@@ -116,7 +275,10 @@ def _heuristic_count(word: str) -> int:
     4. Minimum 1 syllable
     """
     word = word.lower().strip()
-    word = re.sub(r"[^a-z]", "", word)
+    if word.isascii():
+        word = word.translate(_NON_LETTER_ASCII)
+    else:
+        word = _NON_LETTER_RE.sub("", word)
     
     if not word:
         return 0
@@ -124,14 +286,9 @@ def _heuristic_count(word: str) -> int:
     # Vowels
     vowels = "aeiouy"
     
-    # Count vowel groups
-    count = 0
-    prev_was_vowel = False
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_was_vowel:
-            count += 1
-        prev_was_vowel = is_vowel
+    # Count vowel groups (word is plain a-z by now, so bytes are safe
+    # and beat a per-character loop)
+    count = len(word.encode("ascii").translate(_CONSONANTS_TO_SPACE).split())
     
     # Subtract for silent-e at end (but not "le" endings like "able")
     if word.endswith("e") and len(word) > 2:
@@ -154,11 +311,13 @@ def _heuristic_count(word: str) -> int:
     return max(1, count)
 
 
+@lru_cache(maxsize=8192)
 def count_syllables(word: str) -> int:
     """
     Count syllables in a word.
     
     Uses CMU dictionary if available, falls back to heuristic.
+    Results are cached per word.
     """
     if not word or not word.strip():
         return 0
@@ -188,11 +347,20 @@ def count_syllables_detailed(word: str) -> Tuple[int, str]:
     return (_heuristic_count(word), "heuristic")
 
 
+@lru_cache(maxsize=1024)
 def count_line_syllables(line: str) -> int:
-    """Count total syllables in a line of text."""
+    """Count total syllables in a line of text (cached per line)."""
     if not line:
         return 0
     
     # Split on whitespace and punctuation, keep only words
-    words = re.findall(r"[a-zA-Z'-]+", line)
-    return sum(count_syllables(w) for w in words)
+    return sum(map(count_syllables, _WORD_RE.findall(line)))
+
+
+def clear_caches() -> None:
+    """Clear the per-word and per-line caches in this module."""
+    get_phonemes.cache_clear()
+    count_syllables_cmu.cache_clear()
+    _heuristic_count.cache_clear()
+    count_syllables.cache_clear()
+    count_line_syllables.cache_clear()
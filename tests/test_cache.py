@@ -0,0 +1,66 @@
+"""
+Tests for cache.py - persistent LLM response cache.
+"""
+
+from sonnet.cache import MemoryCache, ResponseCache, make_key
+
+
+class TestMakeKey:
+    """Tests for cache key hashing."""
+    
+    def test_deterministic(self):
+        """Same parts give the same key."""
+        assert make_key("llama3", "prompt") == make_key("llama3", "prompt")
+    
+    def test_parts_are_separated(self):
+        """Moving text between parts changes the key."""
+        assert make_key("ab", "c") != make_key("a", "bc")
+
+
+class TestResponseCache:
+    """Tests for the SQLite response cache."""
+    
+    def test_miss_returns_none(self, tmp_path):
+        """Unknown keys are misses."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        assert cache.get("missing") is None
+    
+    def test_set_then_get(self, tmp_path):
+        """Stored values come back."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.set("key", "1. A line")
+        assert cache.get("key") == "1. A line"
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Values survive reopening the cache file."""
+        path = tmp_path / "nested" / "cache.sqlite3"
+        ResponseCache(path).set("key", "value")
+        assert ResponseCache(path).get("key") == "value"
+    
+    def test_expired_is_miss(self, tmp_path):
+        """Entries past their TTL are ignored."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=-1)
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU cache."""
+    
+    def test_set_then_get(self):
+        """Stored values come back; unknown keys are misses."""
+        cache = MemoryCache()
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+    
+    def test_evicts_least_recently_used(self):
+        """A full cache drops the entry used longest ago."""
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
@@ -62,6 +62,15 @@ class TestCheckSyllables:
         results = check_syllables(lines, form)
         assert results[0].passed
         assert results[0].expected == "any"
+    
+    def test_line_past_targets_unconstrained(self):
+        """Lines beyond a per-line target list are reported as 'any'."""
+        form = get_form("haiku")
+        lines = ["old pond", "a frog jumps in", "splash", "an extra line"]
+        results = check_syllables(lines, form)
+        assert len(results) == 4
+        assert results[3].passed
+        assert results[3].expected == "any"
 
 
 class TestCheckRhymes:
@@ -218,3 +227,12 @@ class TestFormatAnalysis:
         assert "Haiku" in output
         assert "PASS" in output
         assert "Syllables:" in output
+    
+    def test_format_free_verse(self):
+        """Unconstrained syllable lines render as 'any' without a count."""
+        form = get_form("free_verse")
+        analysis = check_poem(["The cat sat on the mat", "A dog ran by"], form)
+        output = format_analysis(analysis)
+        assert "  Line 1: any [OK]" in output
+        assert "  Line 2: any [OK]" in output
+        assert "/any" not in output
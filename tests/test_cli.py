@@ -3,8 +3,6 @@ Tests for cli.py - CLI commands.
 """
 
 import pytest
-import tempfile
-import os
 from typer.testing import CliRunner
 from sonnet.cli import app
 
@@ -25,6 +23,18 @@ class TestMain:
         result = runner.invoke(app, [])
         assert result.exit_code == 0
         assert "Usage" in result.output or "sonnet" in result.output
+    
+    def test_dictionary_preloaded_only_when_needed(self, monkeypatch):
+        """Dictionary-backed commands start the preload; others don't."""
+        started = []
+        monkeypatch.delenv("SONNET_NO_PRELOAD", raising=False)
+        monkeypatch.setattr("sonnet.syllables.preload_cmu_dict", lambda: started.append(1))
+        
+        runner.invoke(app, ["forms"])
+        assert started == []
+        
+        runner.invoke(app, ["rhymes", "cat", "--limit", "1"])
+        assert started == [1]
 
 
 class TestFormsCommand:
@@ -64,17 +74,13 @@ class TestCheckCommand:
         # Just check it runs
         assert "Haiku" in result.output or "haiku" in result.output.lower()
     
-    def test_check_file(self):
+    def test_check_file(self, tmp_path):
         """Check poem from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("An old silent pond\nA frog jumps in\nSplash\n")
-            path = f.name
+        path = tmp_path / "poem.txt"
+        path.write_text("An old silent pond\nA frog jumps in\nSplash\n")
         
-        try:
-            result = runner.invoke(app, ["check", path, "--form", "haiku"])
-            assert "Haiku" in result.output or "haiku" in result.output.lower()
-        finally:
-            os.unlink(path)
+        result = runner.invoke(app, ["check", str(path), "--form", "haiku"])
+        assert "Haiku" in result.output or "haiku" in result.output.lower()
     
     def test_check_missing_input(self):
         """Check without input shows error."""
@@ -103,6 +109,59 @@ class TestGenerateCommand:
             "--theme", "test",
         ])
         assert result.exit_code == 1
+    
+    def test_generate_reads_environment(self, monkeypatch):
+        """SONNET_* settings apply unless overridden by a flag."""
+        configs = []
+        monkeypatch.setenv("SONNET_NO_PRELOAD", "1")
+        monkeypatch.setenv("SONNET_WORKERS", "4")
+        monkeypatch.setenv("SONNET_MODEL", "mistral")
+        monkeypatch.setattr(
+            "sonnet.generator.generate_poem",
+            lambda form, theme, config: configs.append(config) or ["a line"],
+        )
+        
+        result = runner.invoke(app, ["generate", "--theme", "test"])
+        assert result.exit_code == 0
+        assert configs[-1].parallel_workers == 4
+        assert configs[-1].model == "mistral"
+        
+        result = runner.invoke(app, ["generate", "--theme", "test", "--workers", "2"])
+        assert result.exit_code == 0
+        assert configs[-1].parallel_workers == 2
+        assert configs[-1].model == "mistral"
+    
+    def test_generate_mode_from_environment(self, monkeypatch):
+        """SONNET_GEN_MODE=whole_poem applies unless --per-line is given."""
+        configs = []
+        monkeypatch.setenv("SONNET_NO_PRELOAD", "1")
+        monkeypatch.setenv("SONNET_GEN_MODE", "whole_poem")
+        monkeypatch.setattr(
+            "sonnet.generator.generate_poem",
+            lambda form, theme, config: configs.append(config) or ["a line"],
+        )
+        
+        runner.invoke(app, ["generate", "--theme", "test"])
+        assert configs[-1].whole_poem is True
+        
+        runner.invoke(app, ["generate", "--theme", "test", "--per-line"])
+        assert configs[-1].whole_poem is False
+    
+    def test_generate_cache_settings_from_environment(self, monkeypatch):
+        """SONNET_LLM_CACHE_SIZE and SONNET_LLM_CACHE_FORCE reach the config."""
+        configs = []
+        monkeypatch.setenv("SONNET_NO_PRELOAD", "1")
+        monkeypatch.setenv("SONNET_LLM_CACHE_SIZE", "256")
+        monkeypatch.setenv("SONNET_LLM_CACHE_FORCE", "1")
+        monkeypatch.setattr(
+            "sonnet.generator.generate_poem",
+            lambda form, theme, config: configs.append(config) or ["a line"],
+        )
+        
+        result = runner.invoke(app, ["generate", "--theme", "test"])
+        assert result.exit_code == 0
+        assert configs[-1].memory_cache_size == 256
+        assert configs[-1].cache_sampled is True
 
 
 class TestInteractiveCommand:
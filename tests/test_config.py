@@ -3,11 +3,10 @@ Tests for config.py - configuration loading.
 """
 
 import pytest
-import os
-from unittest.mock import patch
 from sonnet.config import (
     SonnetConfig,
     load_config,
+    invalidate_config_cache,
     get_model,
     get_api_url,
 )
@@ -44,44 +43,67 @@ class TestLoadConfig:
         config = load_config()
         assert isinstance(config, SonnetConfig)
     
-    def test_env_override_model(self):
+    def test_env_override_model(self, monkeypatch):
         """Environment variables override defaults."""
-        with patch.dict(os.environ, {"SONNET_MODEL": "custom-model"}):
-            config = load_config()
-            assert config.model == "custom-model"
+        monkeypatch.setenv("SONNET_MODEL", "custom-model")
+        config = load_config()
+        assert config.model == "custom-model"
     
-    def test_env_override_temperature(self):
+    def test_env_override_temperature(self, monkeypatch):
         """SONNET_TEMPERATURE env var."""
-        with patch.dict(os.environ, {"SONNET_TEMPERATURE": "0.3"}):
-            config = load_config()
-            assert config.temperature == 0.3
+        monkeypatch.setenv("SONNET_TEMPERATURE", "0.3")
+        config = load_config()
+        assert config.temperature == 0.3
     
-    def test_env_override_bool_true(self):
+    def test_env_override_bool_true(self, monkeypatch):
         """Boolean env vars work with various true values."""
-        with patch.dict(os.environ, {"SONNET_VERBOSE": "true"}):
-            config = load_config()
-            assert config.verbose is True
+        monkeypatch.setenv("SONNET_VERBOSE", "true")
+        config = load_config()
+        assert config.verbose is True
         
-        with patch.dict(os.environ, {"SONNET_VERBOSE": "1"}):
-            config = load_config()
-            assert config.verbose is True
+        monkeypatch.setenv("SONNET_VERBOSE", "1")
+        config = load_config()
+        assert config.verbose is True
     
-    def test_env_override_bool_false(self):
+    def test_env_override_bool_false(self, monkeypatch):
         """Boolean env vars default to False for other values."""
-        with patch.dict(os.environ, {"SONNET_VERBOSE": "false"}):
-            config = load_config()
-            assert config.verbose is False
+        monkeypatch.setenv("SONNET_VERBOSE", "false")
+        config = load_config()
+        assert config.verbose is False
+
+
+class TestConfigCache:
+    """Tests for load_config caching."""
+    
+    def test_returns_independent_copies(self):
+        """Mutating a returned config doesn't affect later loads."""
+        config = load_config()
+        config.model = "mutated"
+        assert load_config().model != "mutated"
+    
+    def test_env_change_not_stale(self, monkeypatch):
+        """A changed environment variable bypasses the cached result."""
+        monkeypatch.setenv("SONNET_MODEL", "first")
+        assert load_config().model == "first"
+        monkeypatch.setenv("SONNET_MODEL", "second")
+        assert load_config().model == "second"
+    
+    def test_invalidate(self):
+        """invalidate_config_cache forces a fresh load."""
+        load_config()
+        invalidate_config_cache()
+        assert isinstance(load_config(), SonnetConfig)
 
 
 class TestGetModel:
     """Tests for get_model helper."""
     
-    def test_returns_model(self):
+    def test_returns_model(self, monkeypatch):
         """Returns model name."""
-        with patch.dict(os.environ, {}, clear=True):
-            model = get_model()
-            assert isinstance(model, str)
-            assert len(model) > 0
+        monkeypatch.delenv("SONNET_MODEL", raising=False)
+        model = get_model()
+        assert isinstance(model, str)
+        assert len(model) > 0
 
 
 class TestGetApiUrl:
@@ -5,16 +5,20 @@ Tests for forms.py - poetic form definitions.
 import pytest
 from sonnet.forms import (
     FormDefinition,
+    CompiledForm,
     FORMS,
+    compile_form,
     get_form,
     list_forms,
     get_rhyme_groups,
+    parse_rhyme_scheme,
     get_syllable_target,
     SESTINA_ROTATION,
     SESTINA_ENVOI,
     get_sestina_end_word_order,
     get_sestina_line_end_word,
 )
+from sonnet.meter import MeterType
 
 
 class TestFormDefinition:
@@ -57,40 +61,28 @@ class TestFormDefinition:
         assert fv.rhyme_scheme is None
         assert fv.meter is None
     
-    def test_tanka_structure(self):
-        """Tanka extends haiku with 5-7-5-7-7 syllables."""
-        tanka = FORMS["tanka"]
-        assert tanka.name == "Tanka"
-        assert tanka.lines == 5
-        assert tanka.syllables == [5, 7, 5, 7, 7]
-        assert tanka.rhyme_scheme is None
-        assert tanka.meter is None
-    
-    def test_villanelle_structure(self):
-        """Villanelle has 19 lines with repeating refrains."""
-        villanelle = FORMS["villanelle"]
-        assert villanelle.name == "Villanelle"
-        assert villanelle.lines == 19
-        assert villanelle.syllables == 10
-        assert villanelle.meter == "iambic"
-        # Has complex ABA pattern
-        assert "ABA" in villanelle.rhyme_scheme
-    
-    def test_ghazal_structure(self):
-        """Ghazal has couplets with rhyming second lines."""
-        ghazal = FORMS["ghazal"]
-        assert ghazal.name == "Ghazal"
-        assert ghazal.lines == 10  # 5 couplets
-        # Second lines of each couplet rhyme (AA, BA, CA, etc.)
-        assert "AA" in ghazal.rhyme_scheme
-    
-    def test_pantoum_structure(self):
-        """Pantoum has interlocking quatrains."""
-        pantoum = FORMS["pantoum"]
-        assert pantoum.name == "Pantoum"
-        assert pantoum.lines == 16  # 4 quatrains
-        assert pantoum.syllables == 10
-        assert pantoum.meter == "iambic"
+    @pytest.mark.parametrize("key,name,lines,syllables,meter", [
+        ("tanka", "Tanka", 5, [5, 7, 5, 7, 7], None),
+        ("villanelle", "Villanelle", 19, 10, "iambic"),
+        ("ghazal", "Ghazal", 10, 0, None),  # 5 couplets
+        ("pantoum", "Pantoum", 16, 10, "iambic"),  # 4 quatrains
+    ])
+    def test_form_structure(self, key, name, lines, syllables, meter):
+        """Extended forms have the expected name, length, syllables and meter."""
+        form = FORMS[key]
+        assert (form.name, form.lines, form.syllables, form.meter) == (name, lines, syllables, meter)
+    
+    def test_tanka_no_rhyme(self):
+        """Tanka, like haiku, has no rhyme scheme."""
+        assert FORMS["tanka"].rhyme_scheme is None
+    
+    def test_villanelle_refrains(self):
+        """Villanelle has repeating ABA tercets."""
+        assert "ABA" in FORMS["villanelle"].rhyme_scheme
+    
+    def test_ghazal_couplets(self):
+        """Ghazal couplets share a rhyme on their second lines (AA, BA, CA, ...)."""
+        assert "AA" in FORMS["ghazal"].rhyme_scheme
 
 
 class TestGetForm:
@@ -101,11 +93,10 @@ class TestGetForm:
         form = get_form("haiku")
         assert form.name == "Haiku"
     
-    def test_case_insensitive(self):
+    @pytest.mark.parametrize("name", ["HAIKU", "Haiku", "HaIkU"])
+    def test_case_insensitive(self, name):
         """Form lookup is case-insensitive."""
-        assert get_form("HAIKU").name == "Haiku"
-        assert get_form("Haiku").name == "Haiku"
-        assert get_form("HaIkU").name == "Haiku"
+        assert get_form(name).name == "Haiku"
     
     def test_hyphen_normalized(self):
         """Hyphens normalized to underscores."""
@@ -117,9 +108,8 @@ class TestGetForm:
     
     def test_unknown_form_raises(self):
         """Unknown form raises ValueError."""
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Unknown form: nonexistent"):
             get_form("nonexistent")
-        assert "Unknown form: nonexistent" in str(exc_info.value)
 
 
 class TestListForms:
@@ -174,6 +164,63 @@ class TestGetRhymeGroups:
         assert "B" in groups
 
 
+class TestParseRhymeScheme:
+    """Tests for parse_rhyme_scheme function."""
+    
+    def test_aabba_pattern(self):
+        """Groups are (letter, indices) tuples in first-seen order."""
+        assert parse_rhyme_scheme("AABBA") == (("A", (0, 1, 4)), ("B", (2, 3)))
+    
+    def test_cached(self):
+        """Repeated parses return the same cached object."""
+        assert parse_rhyme_scheme("ABAB") is parse_rhyme_scheme("ABAB")
+    
+    def test_get_rhyme_groups_returns_fresh_dict(self):
+        """Mutating get_rhyme_groups output doesn't poison the cache."""
+        groups = get_rhyme_groups("ABAB")
+        groups["A"].append(99)
+        assert get_rhyme_groups("ABAB")["A"] == [0, 2]
+
+
+class TestCompileForm:
+    """Tests for compile_form and CompiledForm."""
+    
+    def test_get_form_returns_compiled(self):
+        """get_form hands out precompiled forms."""
+        assert isinstance(get_form("haiku"), CompiledForm)
+        assert get_form("haiku") is get_form("Haiku")
+    
+    def test_list_syllables(self):
+        """Per-line syllable lists become a tuple of targets."""
+        haiku = compile_form(FORMS["haiku"])
+        assert haiku.syllable_targets == (5, 7, 5)
+        assert haiku.default_syllables == 0
+    
+    def test_uniform_syllables_expanded(self):
+        """Uniform syllable counts expand to one target per line."""
+        sonnet = compile_form(FORMS["shakespearean"])
+        assert sonnet.syllable_targets == (10,) * 14
+        assert sonnet.default_syllables == 10
+    
+    def test_rhyme_groups_and_meter(self):
+        """Rhyme groups and meter type are resolved once."""
+        limerick = compile_form(FORMS["limerick"])
+        assert limerick.rhyme_groups == (("A", (0, 1, 4)), ("B", (2, 3)))
+        assert limerick.rhyme_pairs == ((0, 1, "A"), (0, 4, "A"), (2, 3, "B"))
+        assert limerick.meter_type == MeterType.ANAPESTIC
+    
+    def test_no_rhyme_or_meter(self):
+        """Forms without rhyme/meter compile to empty values."""
+        haiku = compile_form(FORMS["haiku"])
+        assert haiku.rhyme_groups == ()
+        assert haiku.meter_type is None
+    
+    def test_compiled_passthrough(self):
+        """Compiling an already-compiled form is a no-op."""
+        compiled = get_form("limerick")
+        assert compile_form(compiled) is compiled
+
+
 class TestGetSyllableTarget:
     """Tests for get_syllable_target function."""
     
@@ -200,6 +247,24 @@ class TestGetSyllableTarget:
         """Free verse returns 0 (no constraint)."""
         fv = get_form("free_verse")
         assert get_syllable_target(fv, 0) == 0
+    
+    def test_uniform_past_last_line(self):
+        """Uniform counts still apply past the form's nominal length."""
+        sonnet = get_form("shakespearean")
+        assert get_syllable_target(sonnet, 20) == 10
+    
+    @pytest.mark.parametrize("name", ["haiku", "shakespearean", "free_verse"])
+    def test_raw_definition_matches_compiled(self, name):
+        """Uncompiled definitions give the same targets as compiled ones."""
+        raw, compiled = FORMS[name], get_form(name)
+        for i in range(-1, compiled.lines + 2):
+            assert get_syllable_target(raw, i) == get_syllable_target(compiled, i)
+    
+    def test_raw_form_definition(self):
+        """Uncompiled FormDefinitions are still accepted."""
+        form = FormDefinition("Test", 2, [3, 4], None, None, "Test form")
+        assert get_syllable_target(form, 1) == 4
+        assert get_syllable_target(form, 2) == 0
 
 
 class TestSestinaForm:
@@ -2,23 +2,32 @@
 Tests for generator.py - LLM-based line generation.
 """
 
+import io
+import json
 import os
-import tempfile
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from sonnet.generator import (
     GenerationConfig,
     Candidate,
     build_prompt,
     parse_candidates,
+    iter_candidates,
     get_config_from_env,
     call_llm,
+    clear_caches,
+    close_client,
+    _get_client,
     generate_candidates,
     load_vocabulary,
     check_vocabulary,
     filter_by_vocabulary,
     get_ending_word,
     get_rhyme_word_for_line,
+    get_generation_levels,
+    generate_poem,
+    build_whole_poem_prompt,
+    parse_whole_poems,
 )
 from sonnet.forms import get_form, FormDefinition
 
@@ -47,17 +56,35 @@ class TestGenerationConfig:
 class TestGetConfigFromEnv:
     """Tests for env config loading."""
     
-    def test_default_when_no_env(self):
+    def test_default_when_no_env(self, monkeypatch):
         """Uses defaults when env vars not set."""
-        with patch.dict("os.environ", {}, clear=True):
-            config = get_config_from_env()
-            assert config.model == "llama3"
+        monkeypatch.delenv("SONNET_MODEL", raising=False)
+        config = get_config_from_env()
+        assert config.model == "llama3"
     
-    def test_reads_env_vars(self):
+    def test_reads_env_vars(self, monkeypatch):
         """Reads from environment variables."""
-        with patch.dict("os.environ", {"SONNET_MODEL": "qwen2"}):
-            config = get_config_from_env()
-            assert config.model == "qwen2"
+        monkeypatch.setenv("SONNET_MODEL", "qwen2")
+        config = get_config_from_env()
+        assert config.model == "qwen2"
+    
+    def test_reads_cache_env_vars(self, monkeypatch):
+        """Response cache settings come from SONNET_LLM_CACHE_*."""
+        monkeypatch.setenv("SONNET_LLM_CACHE_SIZE", "16")
+        monkeypatch.setenv("SONNET_LLM_CACHE_FORCE", "1")
+        config = get_config_from_env()
+        assert config.memory_cache_size == 16
+        assert config.cache_sampled is True
+    
+    def test_reads_workers(self, monkeypatch):
+        """SONNET_WORKERS sets how many lines are drafted concurrently."""
+        monkeypatch.setenv("SONNET_WORKERS", "4")
+        assert get_config_from_env().parallel_workers == 4
+    
+    def test_reads_gen_mode(self, monkeypatch):
+        """SONNET_GEN_MODE=whole_poem turns on single-call drafting."""
+        monkeypatch.setenv("SONNET_GEN_MODE", "whole_poem")
+        assert get_config_from_env().whole_poem is True
 
 
 class TestBuildPrompt:
@@ -97,6 +124,17 @@ class TestBuildPrompt:
         form = get_form("shakespearean")
         prompt = build_prompt(form, "love", 0, [])
         assert "iambic" in prompt.lower()
+    
+    def test_prefix_is_identical_across_lines(self):
+        """Form rules and theme lead every prompt, so lines share a prefix."""
+        form = get_form("haiku")
+        lines = ["An old silent pond", "A frog jumps into the pond"]
+        prompts = [build_prompt(form, "autumn", i, lines[:i]) for i in range(3)]
+        prefix = os.path.commonprefix(prompts)
+        assert "5, 7, 5" in prefix
+        assert "autumn" in prefix
+        # Each prompt extends the previous one up to its new line request
+        assert prompts[2].startswith(prompts[1].split("Generate line")[0].rstrip())
 
 
 class TestParseCandidates:
@@ -111,23 +149,14 @@ class TestParseCandidates:
         assert len(candidates) == 3
         assert candidates[0] == "First candidate line"
     
-    def test_period_numbering(self):
-        """Parse period numbering: 1. 2. 3."""
-        response = "1. Line one\n2. Line two"
-        candidates = parse_candidates(response)
-        assert len(candidates) == 2
-    
-    def test_parenthesis_numbering(self):
-        """Parse paren numbering: 1) 2) 3)."""
-        response = "1) Line one\n2) Line two"
-        candidates = parse_candidates(response)
-        assert len(candidates) == 2
-    
-    def test_colon_numbering(self):
-        """Parse colon numbering: 1: 2: 3:."""
-        response = "1: Line one\n2: Line two"
-        candidates = parse_candidates(response)
-        assert len(candidates) == 2
+    @pytest.mark.parametrize("response", [
+        "1. Line one\n2. Line two",
+        "1) Line one\n2) Line two",
+        "1: Line one\n2: Line two",
+    ])
+    def test_numbering_styles(self, response):
+        """Period, paren and colon numbering are all stripped."""
+        assert parse_candidates(response) == ["Line one", "Line two"]
     
     def test_empty_lines_skipped(self):
         """Empty lines are skipped."""
@@ -140,35 +169,188 @@ class TestParseCandidates:
         response = "Line one\nLine two\nLine three"
         candidates = parse_candidates(response)
         assert len(candidates) == 3
+    
+    def test_parse_large_response(self):
+        """Long responses parse line for line."""
+        response = "\n".join(f"{i}. Candidate {i}" for i in range(1, 1001))
+        candidates = parse_candidates(response)
+        assert len(candidates) == 1000
+        assert candidates[-1] == "Candidate 1000"
+
+
+class TestIterCandidates:
+    """Tests for incremental candidate parsing."""
+    
+    def test_matches_parse_candidates(self):
+        """Streamed fragments parse the same as the joined response."""
+        response = "1. Line one\n\n2) Line two\n3: Line three\nLoose line"
+        fragments = [response[i:i + 3] for i in range(0, len(response), 3)]
+        assert list(iter_candidates(fragments)) == parse_candidates(response)
+    
+    def test_yields_before_stream_ends(self):
+        """A candidate is available as soon as its newline arrives."""
+        def fragments():
+            yield "1. First line\n2. Sec"
+            raise AssertionError("read past first candidate")
+        
+        assert next(iter_candidates(fragments())) == "First line"
+
+
+class TestStreamingGeneration:
+    """Tests for scoring candidates as they stream."""
+    
+    @patch("sonnet.generator.stream_llm")
+    def test_stops_on_perfect_candidate(self, mock_stream):
+        """Stream is closed once a candidate meets every constraint."""
+        read = []
+        
+        def fragments(prompt, config):
+            for line in ["1. An old silent pond\n", "2. Frogs\n", "3. More\n"]:
+                read.append(line)
+                yield line
+        
+        mock_stream.side_effect = fragments
+        form = FormDefinition(
+            name="Test", lines=1, syllables=5,
+            rhyme_scheme=None, meter=None, description="Test",
+        )
+        config = GenerationConfig(stream=True)
+        
+        poem = generate_poem(form, "pond", config)
+        
+        assert poem == ["An old silent pond"]
+        assert len(read) == 1
+    
+    @patch("sonnet.generator.stream_llm")
+    def test_picks_best_when_none_perfect(self, mock_stream):
+        """Without a perfect line, the best-scoring one wins."""
+        mock_stream.side_effect = lambda p, c: (f for f in ["1. A frog\n2. A frog jumps in\n"])
+        form = FormDefinition(
+            name="Test", lines=1, syllables=5,
+            rhyme_scheme=None, meter=None, description="Test",
+        )
+        config = GenerationConfig(stream=True)
+        
+        assert generate_poem(form, "pond", config) == ["A frog jumps in"]
+    
+    @patch("sonnet.generator.stream_llm")
+    def test_generate_candidates_respects_limit(self, mock_stream):
+        """At most num_candidates are read from the stream."""
+        mock_stream.side_effect = lambda p, c: (f for f in ["one\ntwo\nthree\nfour\n"])
+        form = get_form("haiku")
+        config = GenerationConfig(stream=True, num_candidates=2)
+        
+        candidates = generate_candidates(form, "test", 0, [], config=config)
+        assert [c.text for c in candidates] == ["one", "two"]
 
 
 class TestCallLLM:
     """Tests for LLM API calls."""
     
-    def test_requires_httpx(self):
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        """Start each test with empty in-process response caches."""
+        clear_caches()
+        yield
+        clear_caches()
+    
+    def test_requires_httpx(self, monkeypatch):
         """Raises error if httpx not available."""
-        with patch("sonnet.generator.HAS_HTTPX", False):
-            config = GenerationConfig()
-            with pytest.raises(RuntimeError, match="httpx"):
-                call_llm("test prompt", config)
-    
-    @patch("sonnet.generator.HAS_HTTPX", True)
-    @patch("sonnet.generator.httpx")
-    def test_calls_api(self, mock_httpx):
-        """Calls the API with correct payload."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"response": "Generated text"}
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
-        mock_httpx.Client.return_value = mock_client
+        monkeypatch.setattr("sonnet.generator.HAS_HTTPX", False)
+        with pytest.raises(RuntimeError, match="httpx"):
+            call_llm("test prompt", GenerationConfig())
+    
+    @staticmethod
+    def route_httpx(monkeypatch, handler):
+        """Make the shared LLM client send its requests to handler."""
+        import httpx
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr("sonnet.generator._get_client", lambda: client)
+    
+    @pytest.fixture
+    def llm_requests(self, monkeypatch):
+        """Answer every LLM request with canned text; returns the requests received."""
+        import httpx
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"response": "Generated text"})
         
+        self.route_httpx(monkeypatch, handler)
+        return requests
+    
+    def test_calls_api(self, llm_requests):
+        """Calls the API with correct payload."""
         config = GenerationConfig(model="test-model")
         result = call_llm("test prompt", config)
         
         assert result == "Generated text"
-        mock_client.post.assert_called_once()
+        assert len(llm_requests) == 1
+        payload = json.loads(llm_requests[0].content)
+        assert payload["model"] == "test-model"
+        assert payload["prompt"] == "test prompt"
+    
+    def test_http_error_raises(self, monkeypatch):
+        """A failed request surfaces as RuntimeError."""
+        import httpx
+        self.route_httpx(monkeypatch, lambda request: httpx.Response(500))
+        with pytest.raises(RuntimeError, match="LLM call failed"):
+            call_llm("test prompt", GenerationConfig())
+    
+    def test_client_reused(self):
+        """Calls share one pooled client until it is closed."""
+        client = _get_client()
+        try:
+            assert _get_client() is client
+        finally:
+            close_client()
+        assert client.is_closed
+        assert _get_client() is not client
+        close_client()
+    
+    def test_caches_deterministic_responses(self, llm_requests, tmp_path):
+        """Temperature 0 responses are served from the cache on repeat."""
+        config = GenerationConfig(temperature=0, cache_path=str(tmp_path / "c.sqlite3"))
+        assert call_llm("same prompt", config) == "Generated text"
+        assert call_llm("same prompt", config) == "Generated text"
+        assert len(llm_requests) == 1
+        
+        # Sampled responses are never cached
+        config.temperature = 0.8
+        call_llm("same prompt", config)
+        assert len(llm_requests) == 2
+    
+    def test_disk_cache_outlives_memory_cache(self, llm_requests, tmp_path):
+        """Clearing the in-process cache falls back to the on-disk one."""
+        config = GenerationConfig(temperature=0, cache_path=str(tmp_path / "c.sqlite3"))
+        call_llm("same prompt", config)
+        clear_caches()
+        assert call_llm("same prompt", config) == "Generated text"
+        assert len(llm_requests) == 1
+    
+    def test_memory_cache_without_disk(self, llm_requests):
+        """Repeated prompts are served in-process even with no cache file."""
+        config = GenerationConfig(temperature=0, cache_path=None)
+        call_llm("same prompt", config)
+        call_llm("same prompt", config)
+        assert len(llm_requests) == 1
+        
+        # A zero-size memory cache disables it
+        config.memory_cache_size = 0
+        call_llm("same prompt", config)
+        assert len(llm_requests) == 2
+    
+    def test_cache_sampled_opt_in(self, llm_requests):
+        """cache_sampled caches temperature > 0 responses, keyed by temperature."""
+        config = GenerationConfig(temperature=0.8, cache_path=None, cache_sampled=True)
+        call_llm("same prompt", config)
+        call_llm("same prompt", config)
+        assert len(llm_requests) == 1
+        
+        config.temperature = 0.9
+        call_llm("same prompt", config)
+        assert len(llm_requests) == 2
 
 
 class TestGenerateCandidates:
@@ -177,7 +359,7 @@ class TestGenerateCandidates:
     @patch("sonnet.generator.call_llm")
     def test_returns_candidates(self, mock_llm):
         """Returns list of Candidate objects."""
-        mock_llm.return_value = "1. Line one\n2. Line two\n3. Line three"
+        mock_llm.side_effect = ["1. Line one\n2. Line two\n3. Line three"]
         
         form = get_form("haiku")
         config = GenerationConfig(num_candidates=3)
@@ -196,7 +378,7 @@ class TestGenerateCandidates:
     @patch("sonnet.generator.call_llm")
     def test_respects_num_candidates(self, mock_llm):
         """Limits to num_candidates."""
-        mock_llm.return_value = "1. A\n2. B\n3. C\n4. D\n5. E\n6. F"
+        mock_llm.side_effect = ["1. A\n2. B\n3. C\n4. D\n5. E\n6. F"]
         
         form = get_form("haiku")
         config = GenerationConfig(num_candidates=3)
@@ -213,7 +395,7 @@ class TestGenerateCandidates:
     @patch("sonnet.generator.call_llm")
     def test_vocabulary_filter(self, mock_llm):
         """Filters candidates by vocabulary when set."""
-        mock_llm.return_value = "1. cat sat mat\n2. the elephant runs\n3. a fat cat"
+        mock_llm.side_effect = ["1. cat sat mat\n2. the elephant runs\n3. a fat cat"]
         
         form = get_form("haiku")
         vocab = {"cat", "sat", "mat", "a", "fat"}
@@ -234,38 +416,29 @@ class TestGenerateCandidates:
 class TestVocabulary:
     """Tests for vocabulary constraint functions."""
     
-    def test_load_vocabulary_from_file(self):
+    def test_load_vocabulary_from_file(self, tmp_path):
         """Load vocabulary from a file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("apple\nbanana\ncherry\n")
-            f.flush()
-            
-            vocab = load_vocabulary(f.name)
-            
-            assert vocab == {"apple", "banana", "cherry"}
-            os.unlink(f.name)
+        path = tmp_path / "vocab.txt"
+        path.write_text("apple\nbanana\ncherry\n")
+        
+        vocab = load_vocabulary(str(path))
+        
+        assert vocab == {"apple", "banana", "cherry"}
+    
+    def test_load_vocabulary_from_file_object(self):
+        """An open text file is read directly."""
+        vocab = load_vocabulary(io.StringIO("apple\nbanana\ncherry\n"))
+        assert vocab == {"apple", "banana", "cherry"}
     
     def test_load_vocabulary_lowercases(self):
         """Vocabulary is lowercased."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Apple\nBANANA\nCheRRy\n")
-            f.flush()
-            
-            vocab = load_vocabulary(f.name)
-            
-            assert vocab == {"apple", "banana", "cherry"}
-            os.unlink(f.name)
+        vocab = load_vocabulary(io.StringIO("Apple\nBANANA\nCheRRy\n"))
+        assert vocab == {"apple", "banana", "cherry"}
     
     def test_load_vocabulary_skips_empty_lines(self):
         """Empty lines are skipped."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("apple\n\nbanana\n\n\ncherry\n")
-            f.flush()
-            
-            vocab = load_vocabulary(f.name)
-            
-            assert vocab == {"apple", "banana", "cherry"}
-            os.unlink(f.name)
+        vocab = load_vocabulary(io.StringIO("apple\n\nbanana\n\n\ncherry\n"))
+        assert vocab == {"apple", "banana", "cherry"}
     
     def test_check_vocabulary_all_valid(self):
         """All words in vocabulary returns True."""
@@ -282,6 +455,12 @@ class TestVocabulary:
         vocab = {"hello", "world"}
         assert check_vocabulary("Hello, world!", vocab) is True
     
+    def test_check_vocabulary_splits_like_letters_only(self):
+        """Digits, apostrophes and non-ASCII letters separate words on both paths."""
+        vocab = {"don", "t", "caf", "tea"}
+        assert check_vocabulary("Don't 2tea", vocab) is True
+        assert check_vocabulary("Don't café", vocab) is True
+    
     def test_filter_by_vocabulary(self):
         """Filters candidates correctly."""
         vocab = {"the", "cat", "sat"}
@@ -330,6 +509,14 @@ class TestGetEndingWord:
     def test_lowercase_result(self):
         """Result is lowercased."""
         assert get_ending_word("THE END") == "end"
+    
+    def test_unicode_punctuation(self):
+        """Curly quotes and dashes are stripped too."""
+        assert get_ending_word("She said “goodbye” —") == "goodbye"
+    
+    def test_keeps_underscores(self):
+        """Underscores count as word characters."""
+        assert get_ending_word("snake_case!") == "snake_case"
 
 
 class TestGetRhymeWordForLine:
@@ -341,54 +528,24 @@ class TestGetRhymeWordForLine:
         assert get_rhyme_word_for_line(form, 0, []) is None
         assert get_rhyme_word_for_line(form, 1, ["line one"]) is None
     
-    def test_first_line_of_scheme_no_constraint(self):
-        """First line with a new letter has no rhyme constraint."""
-        form = get_form("limerick")  # AABBA
-        # Line 0 (A) - first A, no prior A line
-        assert get_rhyme_word_for_line(form, 0, []) is None
-        
-    def test_second_a_line_rhymes_with_first(self):
-        """Second A line should rhyme with first A line."""
-        form = get_form("limerick")  # AABBA
-        prior_lines = ["There once was a man from Maine"]
-        # Line 1 (A) - should rhyme with line 0 (A)
-        rhyme_word = get_rhyme_word_for_line(form, 1, prior_lines)
-        assert rhyme_word == "maine"
-    
-    def test_new_letter_no_constraint(self):
-        """First line with new letter has no constraint."""
-        form = get_form("limerick")  # AABBA
-        prior_lines = [
-            "There once was a man from Maine",
-            "Who danced in the pouring rain",
-        ]
-        # Line 2 (B) - first B line, no prior B
-        assert get_rhyme_word_for_line(form, 2, prior_lines) is None
-    
-    def test_second_b_line_rhymes_with_first_b(self):
-        """Second B line should rhyme with first B line."""
-        form = get_form("limerick")  # AABBA
-        prior_lines = [
-            "There once was a man from Maine",
-            "Who danced in the pouring rain",
-            "He slipped on ice",
-        ]
-        # Line 3 (B) - should rhyme with line 2 (B)
-        rhyme_word = get_rhyme_word_for_line(form, 3, prior_lines)
-        assert rhyme_word == "ice"
-    
-    def test_final_a_line_rhymes_with_first_a(self):
-        """Final A line (in AABBA) should rhyme with first A."""
-        form = get_form("limerick")  # AABBA
-        prior_lines = [
-            "There once was a man from Maine",
-            "Who danced in the pouring rain",
-            "He slipped on ice",
-            "Which wasn't too nice",
-        ]
-        # Line 4 (A) - should rhyme with line 0 (A), the first A
-        rhyme_word = get_rhyme_word_for_line(form, 4, prior_lines)
-        assert rhyme_word == "maine"
+    LIMERICK = [
+        "There once was a man from Maine",
+        "Who danced in the pouring rain",
+        "He slipped on ice",
+        "Which wasn't too nice",
+    ]
+    
+    @pytest.mark.parametrize("idx,expected", [
+        (0, None),     # first A: no constraint
+        (1, "maine"),  # second A rhymes with the first A
+        (2, None),     # first B: no constraint
+        (3, "ice"),    # second B rhymes with the first B
+        (4, "maine"),  # final A rhymes with the first A
+    ])
+    def test_limerick_progression(self, idx, expected):
+        """Each AABBA line rhymes with the first line of its group."""
+        form = get_form("limerick")
+        assert get_rhyme_word_for_line(form, idx, self.LIMERICK[:idx]) == expected
     
     def test_shakespearean_sonnet_abab(self):
         """Shakespearean sonnet ABAB pattern in first quatrain."""
@@ -471,3 +628,92 @@ class TestGetRhymeWordForLine:
         ]
         rhyme_word = get_rhyme_word_for_line(form, 3, prior)
         assert rhyme_word == "hello"
+
+
+class TestGenerationLevels:
+    """Tests for grouping lines into concurrently-generated levels."""
+    
+    def test_unrhymed_single_level(self):
+        """Unrhymed forms put every line in one level."""
+        assert get_generation_levels(get_form("haiku")) == [[0, 1, 2]]
+    
+    def test_limerick_levels(self):
+        """AABBA: group leaders first, then their rhyming lines."""
+        assert get_generation_levels(get_form("limerick")) == [[0, 2], [1, 3, 4]]
+
+
+class TestParallelGeneratePoem:
+    """Tests for generate_poem with parallel_workers > 1."""
+    
+    @patch("sonnet.generator.call_llm")
+    def test_followers_rhyme_with_leaders(self, mock_llm):
+        """Follower lines get the committed leader's ending word."""
+        prompts = []
+        
+        def fake_llm(prompt, config):
+            prompts.append(prompt)
+            return "1. a line that ends in day"
+        
+        mock_llm.side_effect = fake_llm
+        form = get_form("limerick")
+        lines = generate_poem(form, "test", GenerationConfig(parallel_workers=3))
+        
+        assert lines == ["a line that ends in day"] * 5
+        assert sum("rhyme with 'day'" in p for p in prompts) == 3
+    
+    @patch("sonnet.generator.call_llm")
+    def test_empty_line_retried(self, mock_llm):
+        """A line with no candidates is retried once."""
+        mock_llm.side_effect = ["", "1. second try"]
+        form = FormDefinition("One", 1, 0, None, None, "One line")
+        lines = generate_poem(form, "test", GenerationConfig(parallel_workers=2))
+        
+        assert lines == ["second try"]
+        assert mock_llm.call_count == 2
+
+
+class TestWholePoemGeneration:
+    """Tests for drafting every line in a single LLM call."""
+    
+    RESPONSE = (
+        "Poem 1:\n1. An old silent pond\n2. A frog jumps into the pond\n3. Splash silence again\n"
+        "\nPoem 2:\n1. Rain on the roof\n2. Puddles gather by the door\n"
+    )
+    
+    def test_prompt_asks_for_labeled_drafts(self):
+        """The prompt carries the form rules, theme and draft count."""
+        prompt = build_whole_poem_prompt(get_form("haiku"), "autumn", 3)
+        assert "5, 7, 5" in prompt
+        assert "autumn" in prompt
+        assert "3 different complete versions" in prompt
+    
+    def test_parse_whole_poems(self):
+        """Responses split on Poem N: labels, capped at n_lines."""
+        assert parse_whole_poems(self.RESPONSE, 2) == [
+            ["An old silent pond", "A frog jumps into the pond"],
+            ["Rain on the roof", "Puddles gather by the door"],
+        ]
+    
+    def test_unlabeled_response_is_one_draft(self):
+        """Without labels the whole response is a single draft."""
+        assert parse_whole_poems("1. a\n2. b", 3) == [["a", "b"]]
+    
+    @patch("sonnet.generator.call_llm")
+    def test_single_call(self, mock_llm):
+        """Every line comes from one LLM call when all drafts cover it."""
+        mock_llm.side_effect = [self.RESPONSE.replace("by the door\n", "by the door\n3. Cold tea\n")]
+        lines = generate_poem(get_form("haiku"), "nature", GenerationConfig(whole_poem=True))
+        
+        assert mock_llm.call_count == 1
+        assert lines[0] in ("An old silent pond", "Rain on the roof")
+        assert len(lines) == 3
+    
+    @patch("sonnet.generator.call_llm")
+    def test_uncovered_line_falls_back(self, mock_llm):
+        """A position no draft reaches is generated on its own."""
+        mock_llm.side_effect = ["Poem 1:\n1. An old silent pond", "1. A frog jumps in", "1. Splash"]
+        lines = generate_poem(get_form("haiku"), "nature", GenerationConfig(whole_poem=True))
+        
+        assert lines == ["An old silent pond", "A frog jumps in", "Splash"]
+        assert mock_llm.call_count == 3
+
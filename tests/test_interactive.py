@@ -4,12 +4,20 @@ Tests for interactive.py - TUI helpers.
 
 import pytest
 import json
-import tempfile
 import os
+import threading
+from unittest.mock import patch, MagicMock
+from sonnet.forms import get_form
+from sonnet.generator import Candidate
 from sonnet.interactive import (
+    HAS_RICH,
     PoemProgress,
     save_progress,
+    save_progress_async,
+    flush_progress,
     load_progress,
+    run_interactive,
+    get_user_selection,
 )
 
 
@@ -41,7 +49,7 @@ class TestPoemProgress:
 class TestSaveProgress:
     """Tests for save_progress function."""
     
-    def test_save_creates_file(self):
+    def test_save_creates_file(self, tmp_path):
         """Save creates a JSON file."""
         progress = PoemProgress(
             form_name="haiku",
@@ -49,46 +57,94 @@ class TestSaveProgress:
             lines=["line one", "line two"],
             current_line=2,
         )
+        path = tmp_path / "progress.json"
         
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            path = f.name
+        save_progress(progress, str(path))
+        assert path.exists()
         
-        try:
-            save_progress(progress, path)
-            assert os.path.exists(path)
-            
-            with open(path, "r") as f:
-                data = json.load(f)
-            
-            assert data["form_name"] == "haiku"
-            assert data["theme"] == "test"
-            assert data["lines"] == ["line one", "line two"]
-        finally:
-            os.unlink(path)
+        data = json.loads(path.read_text())
+        assert data["form_name"] == "haiku"
+        assert data["theme"] == "test"
+        assert data["lines"] == ["line one", "line two"]
     
-    def test_save_overwrites(self):
+    def test_save_overwrites(self, tmp_path):
         """Save overwrites existing file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            path = f.name
-            f.write('{"old": "data"}')
+        path = tmp_path / "progress.json"
+        path.write_text('{"old": "data"}')
         
-        try:
-            progress = PoemProgress("test", "theme", ["new"])
-            save_progress(progress, path)
-            
-            with open(path, "r") as f:
-                data = json.load(f)
-            
-            assert "old" not in data
-            assert data["form_name"] == "test"
-        finally:
-            os.unlink(path)
+        progress = PoemProgress("test", "theme", ["new"])
+        save_progress(progress, str(path))
+        
+        data = json.loads(path.read_text())
+        assert "old" not in data
+        assert data["form_name"] == "test"
+    
+    def test_save_is_atomic(self, tmp_path, monkeypatch):
+        """A failed save leaves the old file intact and no temp file behind."""
+        path = tmp_path / "progress.json"
+        path.write_text('{"old": "data"}')
+        
+        def fail(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            save_progress(PoemProgress("test", "theme", ["new"]), str(path))
+        
+        assert path.read_text() == '{"old": "data"}'
+        assert [p.name for p in tmp_path.iterdir()] == ["progress.json"]
+
+
+class TestSaveProgressAsync:
+    """Tests for background progress saving."""
+    
+    def test_flush_writes_latest(self, tmp_path):
+        """After flushing, the file holds the most recent save."""
+        path = str(tmp_path / "progress.json")
+        
+        for n in range(1, 6):
+            progress = PoemProgress("haiku", "rain", ["line"] * n, n)
+            save_progress_async(progress, path)
+        flush_progress()
+        
+        loaded = load_progress(path)
+        assert loaded.current_line == 5
+        assert len(loaded.lines) == 5
+        assert [p.name for p in tmp_path.iterdir()] == ["progress.json"]
+    
+    def test_snapshots_state(self, tmp_path):
+        """Later mutation of the lines list doesn't leak into the save."""
+        path = str(tmp_path / "progress.json")
+        
+        lines = ["first"]
+        save_progress_async(PoemProgress("haiku", "rain", lines, 1), path)
+        lines.append("second")
+        flush_progress()
+        
+        assert load_progress(path).lines == ["first"]
+
+
+class TestJsonBackends:
+    """Progress files round-trip with and without orjson."""
+    
+    @pytest.mark.parametrize("has_orjson", [False, True])
+    def test_roundtrip(self, has_orjson, tmp_path):
+        """Save and load agree, including non-ASCII text."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        original = PoemProgress("haiku", "café", ["naïve line"], 1)
+        path = str(tmp_path / "progress.json")
+        
+        with patch("sonnet.interactive.HAS_ORJSON", has_orjson):
+            save_progress(original, path)
+            loaded = load_progress(path)
+        assert loaded == original
 
 
 class TestLoadProgress:
     """Tests for load_progress function."""
     
-    def test_load_valid_file(self):
+    def test_load_valid_file(self, tmp_path):
         """Load a valid progress file."""
         data = {
             "form_name": "limerick",
@@ -96,62 +152,46 @@ class TestLoadProgress:
             "lines": ["line 1", "line 2"],
             "current_line": 2,
         }
+        path = tmp_path / "progress.json"
+        path.write_text(json.dumps(data))
         
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            path = f.name
-        
-        try:
-            progress = load_progress(path)
-            assert progress.form_name == "limerick"
-            assert progress.theme == "humor"
-            assert progress.lines == ["line 1", "line 2"]
-            assert progress.current_line == 2
-        finally:
-            os.unlink(path)
+        progress = load_progress(str(path))
+        assert progress.form_name == "limerick"
+        assert progress.theme == "humor"
+        assert progress.lines == ["line 1", "line 2"]
+        assert progress.current_line == 2
     
-    def test_load_missing_current_line(self):
+    def test_load_missing_current_line(self, tmp_path):
         """Load file without current_line uses len(lines)."""
         data = {
             "form_name": "haiku",
             "theme": "nature",
             "lines": ["one", "two", "three"],
         }
+        path = tmp_path / "progress.json"
+        path.write_text(json.dumps(data))
         
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            path = f.name
-        
-        try:
-            progress = load_progress(path)
-            assert progress.current_line == 3  # len(lines)
-        finally:
-            os.unlink(path)
+        progress = load_progress(str(path))
+        assert progress.current_line == 3  # len(lines)
     
     def test_load_missing_file(self):
         """Load raises FileNotFoundError for missing file."""
         with pytest.raises(FileNotFoundError):
             load_progress("/nonexistent/path.json")
     
-    def test_load_invalid_format(self):
+    def test_load_invalid_format(self, tmp_path):
         """Load raises ValueError for invalid format."""
-        data = {"wrong": "format"}
-        
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            path = f.name
+        path = tmp_path / "progress.json"
+        path.write_text(json.dumps({"wrong": "format"}))
         
-        try:
-            with pytest.raises(ValueError, match="Invalid progress file"):
-                load_progress(path)
-        finally:
-            os.unlink(path)
+        with pytest.raises(ValueError, match="Invalid progress file"):
+            load_progress(str(path))
 
 
 class TestRoundTrip:
     """Tests for save/load round trip."""
     
-    def test_save_load_roundtrip(self):
+    def test_save_load_roundtrip(self, tmp_path):
         """Data survives save and load."""
         original = PoemProgress(
             form_name="shakespearean",
@@ -159,17 +199,142 @@ class TestRoundTrip:
             lines=["Line 1", "Line 2", "Line 3"],
             current_line=3,
         )
+        path = str(tmp_path / "progress.json")
         
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            path = f.name
+        save_progress(original, path)
+        loaded = load_progress(path)
         
+        assert loaded.form_name == original.form_name
+        assert loaded.theme == original.theme
+        assert loaded.lines == original.lines
+        assert loaded.current_line == original.current_line
+
+
+@pytest.mark.skipif(not HAS_RICH, reason="rich not installed")
+class TestRunInteractivePrefetch:
+    """Tests for speculative next-line generation in run_interactive."""
+    
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Record generate_candidates calls and answer with two candidates."""
+        calls = {"main": [], "background": []}
+        
+        def fake_generate(form, theme, line_index, prior_lines, config=None):
+            on_main = threading.current_thread() is threading.main_thread()
+            calls["main" if on_main else "background"].append(list(prior_lines))
+            return [
+                Candidate(text=f"first choice {line_index}"),
+                Candidate(text=f"second choice {line_index}"),
+            ]
+        
+        monkeypatch.setattr("sonnet.interactive.generate_candidates", fake_generate)
+        return calls
+    
+    def choose(self, monkeypatch, *choices):
+        answers = iter(choices * 10)
+        monkeypatch.setattr(
+            "sonnet.interactive.get_user_selection", lambda console, count: next(answers)
+        )
+    
+    def test_top_pick_reuses_prefetch(self, calls, monkeypatch):
+        """Picking the top candidate uses the already-drafted next line."""
+        self.choose(monkeypatch, "1")
+        lines = run_interactive(get_form("haiku"), "rain")
+        
+        assert len(lines) == 3
+        assert calls["main"] == [[]]
+        assert calls["background"] == [lines[:1], lines[:2]]
+    
+    def test_other_pick_discards_prefetch(self, calls, monkeypatch):
+        """Any other pick regenerates from the lines actually chosen."""
+        self.choose(monkeypatch, "2")
+        lines = run_interactive(get_form("haiku"), "rain")
+        
+        assert calls["main"] == [[], lines[:1], lines[:2]]
+    
+    def test_prefetch_disabled(self, calls, monkeypatch):
+        """With prefetch off, each line is generated exactly once."""
+        self.choose(monkeypatch, "2")
+        run_interactive(get_form("haiku"), "rain", prefetch=False)
+        
+        assert len(calls["main"]) == 3
+        assert calls["background"] == []
+    
+    def test_one_prefetch_at_a_time(self, monkeypatch):
+        """Regenerating while a prefetch is in flight doesn't start another."""
+        release = threading.Event()
+        started = []
+        drafts = iter(range(1000))
+        
+        def fake_generate(form, theme, line_index, prior_lines, config=None):
+            if threading.current_thread() is not threading.main_thread():
+                started.append(list(prior_lines))
+                release.wait(5)
+            n = next(drafts)
+            return [Candidate(text=f"choice {n}"), Candidate(text=f"other {n}")]
+        
+        monkeypatch.setattr("sonnet.interactive.generate_candidates", fake_generate)
+        self.choose(monkeypatch, "r", "r", "r", "1", "1", "1")
         try:
-            save_progress(original, path)
-            loaded = load_progress(path)
-            
-            assert loaded.form_name == original.form_name
-            assert loaded.theme == original.theme
-            assert loaded.lines == original.lines
-            assert loaded.current_line == original.current_line
+            run_interactive(get_form("haiku"), "rain")
         finally:
-            os.unlink(path)
+            release.set()
+        
+        assert len(started) == 1
+    
+    def test_failed_prefetch_falls_back(self, monkeypatch):
+        """A prefetch that raises is replaced by a fresh request."""
+        calls = {"main": [], "background": []}
+        
+        def fake_generate(form, theme, line_index, prior_lines, config=None):
+            if threading.current_thread() is not threading.main_thread():
+                calls["background"].append(list(prior_lines))
+                raise ConnectionError("model went away")
+            calls["main"].append(list(prior_lines))
+            return [Candidate(text=f"choice {line_index}"), Candidate(text="other")]
+        
+        monkeypatch.setattr("sonnet.interactive.generate_candidates", fake_generate)
+        self.choose(monkeypatch, "1")
+        lines = run_interactive(get_form("haiku"), "rain")
+        
+        assert len(lines) == 3
+        assert calls["background"] == [lines[:1], lines[:2]]
+        assert calls["main"] == [[], lines[:1], lines[:2]]
+
+    
+    def test_quit_saves_progress(self, calls, monkeypatch, tmp_path):
+        """Quitting writes the progress file before returning."""
+        path = str(tmp_path / "progress.json")
+        self.choose(monkeypatch, "1", "q")
+        lines = run_interactive(get_form("haiku"), "rain", save_path=path)
+        
+        assert len(lines) == 1
+        saved = load_progress(path)
+        assert saved.lines == lines
+        assert saved.current_line == 1
+
+
+class TestGetUserSelection:
+    """Tests for candidate selection input."""
+    
+    @patch("sonnet.interactive.Prompt.ask")
+    def test_reprompts_until_valid(self, mock_ask):
+        """Junk and out-of-range input are rejected."""
+        mock_ask.side_effect = ["junk", "7", " 2 "]
+        console = MagicMock()
+        
+        assert get_user_selection(console, 5) == "2"
+        assert console.print.call_count == 2
+    
+    @patch("sonnet.interactive.Prompt.ask")
+    def test_commands_case_insensitive(self, mock_ask):
+        """Command letters are accepted in any case."""
+        mock_ask.return_value = "Q"
+        assert get_user_selection(MagicMock(), 3) == "q"
+    
+    @patch("sonnet.interactive.Prompt.ask")
+    @pytest.mark.parametrize("raw", ["02", "+2", " 2"])
+    def test_numeric_spellings_normalized(self, mock_ask, raw):
+        """Numbers int() accepts are normalized rather than rejected."""
+        mock_ask.return_value = raw
+        assert get_user_selection(MagicMock(), 3) == "2"
@@ -8,6 +8,7 @@ from sonnet.meter import (
     get_expected_pattern,
     match_meter,
     describe_meter,
+    parse_meter,
 )
 
 
@@ -47,6 +48,19 @@ class TestMeterScanner:
         pattern = scan_line("hello")
         assert len(pattern) == 2  # hello = 2 syllables
 
+    def test_scan_line_cached(self):
+        """Rescanning a line returns the cached pattern."""
+        line = "Shall I compare thee to a summer's day"
+        assert scan_line(line) is scan_line(line)
+
+    def test_clear_caches(self):
+        """clear_caches empties the stress caches."""
+        from sonnet.meter import clear_caches
+        scan_line("Shall I compare thee to a summer's day")
+        clear_caches()
+        assert scan_line.cache_info().currsize == 0
+        assert get_word_stress.cache_info().currsize == 0
+
     def test_match_score_perfect(self):
         """Perfect match scores 1.0."""
         # Construct a line that should match iambic exactly
@@ -122,3 +136,31 @@ class TestDescribeMeter:
         desc = describe_meter(MeterType.TROCHAIC, 4)
         assert "trochaic" in desc
         assert "tetrameter" in desc
+
+
+class TestPatternSimilarity:
+    """Tests for bit-packed stress pattern comparison."""
+
+    def test_length_mismatch_pads_unstressed(self):
+        from sonnet.meter import _pattern_similarity
+        # "u/u" vs "u/uu": padded actual matches all 4 positions
+        assert _pattern_similarity("u/u", "u/uu") == 1.0
+        # "u//" vs "u/": padded expected is "u/u", 2 of 3 match
+        assert abs(_pattern_similarity("u//", "u/") - 2 / 3) < 1e-9
+
+    def test_empty(self):
+        from sonnet.meter import _pattern_similarity
+        assert _pattern_similarity("", "u/") == 0.0
+
+
+class TestParseMeter:
+    """Tests for meter name resolution."""
+
+    def test_known_names(self):
+        assert parse_meter("iambic") == MeterType.IAMBIC
+        assert parse_meter("Anapestic") == MeterType.ANAPESTIC
+
+    def test_empty_or_unknown(self):
+        assert parse_meter(None) is None
+        assert parse_meter("") is None
+        assert parse_meter("sprung") is None
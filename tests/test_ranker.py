@@ -3,6 +3,8 @@ Tests for ranker.py - candidate scoring and ranking.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 from sonnet.ranker import (
     RankingScore,
     RankedCandidate,
@@ -11,6 +13,7 @@ from sonnet.ranker import (
     score_rhyme,
     score_meter,
     score_candidate,
+    score_candidates,
     rank_candidates,
     get_best_candidate,
 )
@@ -46,6 +49,12 @@ class TestRankingScore:
             meter_score=0.0,
         )
         assert abs(score.total - 0.4) < 0.01
+    
+    def test_immutable(self):
+        """Scores can't be changed after construction."""
+        score = RankingScore()
+        with pytest.raises(FrozenInstanceError):
+            score.meter_score = 0.0
 
 
 class TestScoreSyllables:
@@ -134,6 +143,29 @@ class TestScoreCandidate:
         assert score.syllable_score >= 0.8
 
 
+class TestScoreCandidates:
+    """Tests for batch candidate scoring."""
+    
+    def test_matches_single_scoring(self):
+        """Batch scores equal per-candidate scores."""
+        constraints = Constraints(
+            target_syllables=10,
+            rhyme_word="day",
+            meter="iambic",
+        )
+        candidates = [
+            "Shall I compare thee to a summer's day",
+            "The cat sat on the mat",
+            "",
+        ]
+        batch = score_candidates(candidates, constraints)
+        assert batch == [score_candidate(c, constraints) for c in candidates]
+    
+    def test_empty(self):
+        """No candidates gives no scores."""
+        assert score_candidates([], Constraints()) == []
+
+
 class TestRankCandidates:
     """Tests for ranking multiple candidates."""
     
@@ -163,6 +195,22 @@ class TestRankCandidates:
         """Empty list returns empty."""
         ranked = rank_candidates([], Constraints())
         assert len(ranked) == 0
+    
+    def test_limit_matches_full_ranking(self):
+        """Limited ranking is the head of the full ranking."""
+        constraints = Constraints(target_syllables=6, rhyme_word="day")
+        candidates = [
+            "The sun came out today",
+            "A cat",
+            "We walked along the bay",
+            "Nothing rhymes with orange here",
+            "Come out and play",
+        ]
+        full = rank_candidates(candidates, constraints)
+        top = rank_candidates(candidates, constraints, limit=2)
+        
+        assert [c.text for c in top] == [c.text for c in full[:2]]
+        assert [c.rank for c in top] == [1, 2]
 
 
 class TestGetBestCandidate:
@@ -185,3 +233,32 @@ class TestGetBestCandidate:
         """Empty list returns None."""
         best = get_best_candidate([], Constraints())
         assert best is None
+    
+    def test_matches_full_ranking(self):
+        """Pruned search picks the same line as full ranking."""
+        constraints = Constraints(
+            target_syllables=10,
+            rhyme_word="day",
+            meter="iambic",
+        )
+        candidates = [
+            "The cat sat on the mat",
+            "I wandered lonely as a cloud today",
+            "Shall I compare thee to a summer's day",
+            "A day",
+        ]
+        best = get_best_candidate(candidates, constraints)
+        ranked = rank_candidates(candidates, constraints)
+        
+        assert best.text == ranked[0].text
+        assert best.score == ranked[0].score
+    
+    def test_stops_at_perfect(self):
+        """Candidates after a perfect one are not scored."""
+        constraints = Constraints(target_syllables=2)
+        
+        with patch("sonnet.ranker.score_syllables", wraps=score_syllables) as spy:
+            best = get_best_candidate(["hello", "goodbye", "farewell"], constraints)
+        
+        assert best.text == "hello"
+        assert spy.call_count == 1
@@ -87,6 +87,18 @@ class TestRhymePhonemes:
         phonemes = get_rhyme_phonemes("poetry")
         assert phonemes is not None
 
+    def test_cached_result_immutable(self):
+        """Cached tails are tuples, so callers can't corrupt the cache."""
+        assert get_rhyme_phonemes("cat") == ("AE1", "T")
+        assert get_rhyme_phonemes("cat") is get_rhyme_phonemes("cat")
+
+    def test_clear_caches(self):
+        """clear_caches empties the word caches."""
+        from sonnet.rhymes import clear_caches
+        get_rhyme_phonemes("cat")
+        clear_caches()
+        assert get_rhyme_phonemes.cache_info().currsize == 0
+
 
 class TestFindRhymes:
     """Tests for finding rhymes from candidates."""
@@ -114,6 +126,16 @@ class TestFindRhymes:
             # All should be perfect for rat/cat/hat
             assert rhymes[0][1] == RhymeType.PERFECT
 
+    def test_matches_check_rhyme(self):
+        """Same verdicts as check_rhyme, perfect first in input order."""
+        candidates = ["night", "dog", "cat", "kit", "Rat", "bat", "xyzzy", "rat"]
+        expected = [(c, check_rhyme("rat", c)) for c in candidates]
+        expected = (
+            [e for e in expected if e[1] == RhymeType.PERFECT]
+            + [e for e in expected if e[1] == RhymeType.SLANT]
+        )
+        assert find_rhymes("rat", candidates) == expected
+
     def test_include_slant_false(self):
         candidates = ["hat", "bet"]  # bet might be slant
         rhymes = find_rhymes("cat", candidates, include_slant=False)
@@ -158,6 +180,40 @@ class TestLastWord:
     def test_single_word(self):
         assert get_last_word("hello") == "hello"
 
+    @pytest.mark.parametrize("line, expected", [
+        ("the dogs'", "dogs'"),
+        ("to be,or", "or"),
+        ("day\tnight", "night"),
+        ("word\u2014word", "word"),
+        ("it's 42!", "it's"),
+        ("...", ""),
+    ])
+    def test_non_space_separators(self, line, expected):
+        """Words split on any non-word character, not just spaces."""
+        assert get_last_word(line) == expected
+
+
+class TestRhymeIndex:
+    """Tests for the precomputed rhyme index."""
+
+    def test_indexes_word(self):
+        """Dictionary words map to their stress-stripped rhyme tail."""
+        from sonnet.rhymes import get_rhyme_index
+        index = get_rhyme_index()
+        assert index.tails["cat"] == ("AE", "T")
+        assert index.syllables["cat"] == 1
+        assert "hat" in index.by_tail[("AE", "T")]
+
+    def test_skips_non_alpha(self):
+        """Words with punctuation or digits aren't indexed."""
+        from sonnet.rhymes import get_rhyme_index
+        assert all(word.isalpha() for word in get_rhyme_index().tails)
+
+    def test_cached(self):
+        """The index is built once."""
+        from sonnet.rhymes import get_rhyme_index
+        assert get_rhyme_index() is get_rhyme_index()
+
 
 class TestSuggestRhymes:
     """Tests for rhyme suggestion feature."""
@@ -201,6 +257,14 @@ class TestSuggestRhymes:
         for word, rhyme_type, syllables in results:
             assert rhyme_type == RhymeType.PERFECT
 
+    def test_suggest_rhymes_sorted_unique(self):
+        """Results are perfect-first, then by syllables and word, without repeats."""
+        from sonnet.rhymes import suggest_rhymes, RhymeType
+        results = suggest_rhymes("night", max_results=300)
+        keys = [(t != RhymeType.PERFECT, s, w) for w, t, s in results]
+        assert keys == sorted(keys)
+        assert len({w for w, t, s in results}) == len(results)
+
     def test_suggest_rhymes_unknown_word(self):
         """Unknown word should return empty list."""
         from sonnet.rhymes import suggest_rhymes
@@ -106,6 +106,139 @@ class TestCMUDictLoader:
         phonemes = get_phonemes("hello!")
         assert phonemes is not None
 
+    def test_unicode_punctuation_stripped(self):
+        """Non-ASCII punctuation is stripped before lookup too."""
+        assert get_phonemes("“hello”") == get_phonemes("hello")
+
+    def test_phonemes_shared(self):
+        """Identical phonemes are the same interned string object."""
+        assert get_phonemes("cat")[0] is get_phonemes("kit")[0]
+
+    def test_data_path_cached(self):
+        """The dictionary file is located once and reused."""
+        from sonnet.syllables import _get_data_path
+        path = _get_data_path()
+        assert path.is_file()
+        assert _get_data_path() is path
+
+
+class TestCMUDictPreload:
+    """Tests for background dictionary loading."""
+
+    def test_preload_populates_dict(self):
+        """A preload thread leaves the shared dictionary loaded."""
+        from sonnet.syllables import preload_cmu_dict
+        thread = preload_cmu_dict()
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+        assert "hello" in get_cmu_dict()
+
+    def test_concurrent_callers_share_one_load(self, monkeypatch):
+        """Callers racing a load all get the same dictionary object."""
+        import threading
+        from sonnet import syllables
+        monkeypatch.setattr(syllables, "_CMU_DICT", None)
+        loads = []
+        real_load = syllables._load_cmu_dict
+
+        def counting_load():
+            loads.append(1)
+            return real_load()
+
+        monkeypatch.setattr(syllables, "_load_cmu_dict", counting_load)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_cmu_dict()))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(loads) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_concurrent_load_restores_gc(self, monkeypatch):
+        """GC is paused for exactly one load and re-enabled afterwards."""
+        import gc
+        import threading
+        import time
+        from sonnet import syllables
+        monkeypatch.setattr(syllables, "_CMU_DICT", None)
+        gc_during_load = []
+
+        def slow_load():
+            gc_during_load.append(gc.isenabled())
+            time.sleep(0.05)
+            return {"cat": [["K", "AE1", "T"]]}
+
+        monkeypatch.setattr(syllables, "_load_cmu_dict", slow_load)
+        threads = [threading.Thread(target=get_cmu_dict) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert gc_during_load == [False]
+        assert gc.isenabled()
+
+    def test_failed_load_restores_gc(self, monkeypatch):
+        """GC comes back on even if loading raises."""
+        import gc
+        from sonnet import syllables
+        monkeypatch.setattr(syllables, "_CMU_DICT", None)
+
+        def failing_load():
+            raise OSError("unreadable")
+
+        monkeypatch.setattr(syllables, "_load_cmu_dict", failing_load)
+        with pytest.raises(OSError):
+            get_cmu_dict()
+        assert gc.isenabled()
+
+
+class TestCMUDictCache:
+    """Tests for the parsed-dictionary marshal cache."""
+
+    SAMPLE = ";;; comment\nCAT  K AE1 T\nTOMATO  T AH0 M EY1 T OW2\nTOMATO(2)  T AH0 M AA1 T OW2\n"
+
+    @pytest.fixture
+    def data_path(self, tmp_path, monkeypatch):
+        from sonnet import syllables
+        path = tmp_path / "cmudict.txt"
+        path.write_text(self.SAMPLE, encoding="utf-8")
+        monkeypatch.setattr(syllables, "_get_data_path", lambda: path)
+        monkeypatch.setattr(syllables, "_USER_CACHE_DIR", tmp_path / "user")
+        return path
+
+    def test_writes_and_reuses_cache(self, data_path):
+        """First load writes the user cache, never the data dir; the next load reads it back."""
+        from sonnet.syllables import _load_cmu_dict, _read_cmu_cache
+        parsed = _load_cmu_dict()
+        assert parsed["tomato"][1] == ["T", "AH0", "M", "AA1", "T", "OW2"]
+        assert (data_path.parent / "user" / "cmudict.txt.marshal").exists()
+        assert not data_path.with_name("cmudict.txt.marshal").exists()
+        assert _read_cmu_cache(data_path) == parsed
+        assert _load_cmu_dict() == parsed
+
+    def test_stale_cache_ignored(self, data_path):
+        """Editing the text file invalidates the cache."""
+        import os
+        from sonnet.syllables import _load_cmu_dict
+        _load_cmu_dict()
+        data_path.write_text(self.SAMPLE + "DOG  D AO1 G\n", encoding="utf-8")
+        os.utime(data_path, ns=(0, 0))
+        assert "dog" in _load_cmu_dict()
+
+    def test_corrupt_cache_ignored(self, data_path):
+        """An unreadable cache file falls back to parsing."""
+        from sonnet.syllables import _load_cmu_dict
+        cache_dir = data_path.parent / "user"
+        cache_dir.mkdir()
+        (cache_dir / "cmudict.txt.marshal").write_bytes(b"garbage")
+        assert "cat" in _load_cmu_dict()
+
 
 class TestSyllableCounter:
     """Tests for syllable counting (Task 3)."""
@@ -228,3 +361,9 @@ class TestHeuristic:
     def test_minimum_one(self):
         # Even weird input should return at least 1
         assert _heuristic_count("xyz") >= 1
+
+    def test_y_counts_as_vowel(self):
+        assert _heuristic_count("gypsy") == 2
+
+    def test_non_ascii_letters_ignored(self):
+        assert _heuristic_count("naïve") == _heuristic_count("nave")